@@ -1,20 +1,43 @@
 """
 NFL Board to show basic info about your favorite team
 """
-import json
-from pathlib import Path
-
-# Load plugin metadata
-_plugin_dir = Path(__file__).parent
-with open(_plugin_dir / "plugin.json") as f:
-    _metadata = json.load(f)
-
-# Expose metadata as module variables (backward compatibility)
-__plugin_id__ = _metadata["name"]
-__version__ = _metadata["version"]
-__description__ = _metadata["description"]
-__board_name__ = _metadata["description"]
-__author__ = _metadata.get("author", "")
-__requirements__ = _metadata.get("requirements", {}).get("python_dependencies", [])
-__min_app_version__ = _metadata.get("requirements", {}).get("app_version", "")
-__preserve_files__ = _metadata.get("preserve_files", [])
+import os
+
+from ._meta import load_precompiled as _load
+
+# Plugin metadata is loaded lazily on first attribute access (PEP 562)
+_plugin_json = os.path.join(os.path.dirname(__file__), "plugin.json")
+_metadata = None
+
+# Module attribute -> accessor into plugin.json (backward compatibility)
+_METADATA_ATTRS = {
+    "__plugin_id__": lambda meta: meta["name"],
+    "__version__": lambda meta: meta["version"],
+    "__description__": lambda meta: meta["description"],
+    "__board_name__": lambda meta: meta["description"],
+    "__author__": lambda meta: meta.get("author", ""),
+    "__requirements__": lambda meta: meta.get("requirements", {}).get("python_dependencies", []),
+    "__min_app_version__": lambda meta: meta.get("requirements", {}).get("app_version", ""),
+    "__preserve_files__": lambda meta: meta.get("preserve_files", []),
+}
+
+__all__ = list(_METADATA_ATTRS)
+
+
+def _load_metadata() -> dict:
+    """Parse plugin.json once and memoize the result."""
+    global _metadata
+    if _metadata is None:
+        _metadata = _load(_plugin_json)
+    return _metadata
+
+
+def __getattr__(name):
+    accessor = _METADATA_ATTRS.get(name)
+    if accessor is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = accessor(_load_metadata())
+    # Cache on the module so later lookups bypass this hook
+    globals()[name] = value
+    return value
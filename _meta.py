@@ -0,0 +1,58 @@
+"""
+Plugin metadata loading shared by the board package modules.
+
+plugin.json can be precompiled into a ``_plugin_meta.py`` dict literal so that
+imports skip JSON parsing entirely:
+
+    python _meta.py
+"""
+import os
+import pprint
+from functools import lru_cache
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+_PLUGIN_META_MODULE = "_plugin_meta.py"
+
+
+@lru_cache(maxsize=None)
+def load(path: str) -> dict:
+    """Parse a plugin.json file once per unique path."""
+    try:
+        with open(path, "rb") as f:
+            return _json.loads(f.read())
+    except ValueError as error:
+        raise ValueError(f"NFL Board: Malformed plugin metadata in {path}: {error}") from error
+
+
+def load_precompiled(path: str) -> dict:
+    """
+    Return metadata from the generated _plugin_meta module when it matches
+    plugin.json, falling back to parsing the JSON file (dev mode / stale build).
+    """
+    try:
+        from ._plugin_meta import METADATA, SOURCE_MTIME_NS
+
+        if SOURCE_MTIME_NS == os.stat(path).st_mtime_ns:
+            return METADATA
+    except (ImportError, OSError):
+        pass
+    return load(path)
+
+
+def generate(path: str) -> str:
+    """Write plugin.json as a Python literal next to it and return the module path."""
+    metadata = load(path)
+    output_path = os.path.join(os.path.dirname(path), _PLUGIN_META_MODULE)
+    with open(output_path, "w") as f:
+        f.write('"""Generated from plugin.json by _meta.py - do not edit."""\n')
+        f.write(f"SOURCE_MTIME_NS = {os.stat(path).st_mtime_ns}\n")
+        f.write(f"METADATA = {pprint.pformat(metadata, width=120)}\n")
+    return output_path
+
+
+if __name__ == "__main__":
+    print(generate(os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugin.json")))
@@ -3,14 +3,26 @@ NFL Board - Clean Implementation
 Displays NFL games and team information using clear, readable logic.
 """
 
-import json
+import dataclasses
+import heapq
 import logging
-from datetime import datetime, time, timedelta, timezone
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
+from apscheduler.jobstores.base import JobLookupError
 from PIL import Image
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 from boards.base_board import BoardBase
 from utils import get_file
 
@@ -19,31 +31,145 @@ from .data import NFLApiClient, NFLDataSnapshot, NFLGame, NFLTeam
 from .logos import NFLLogoManager
 
 debug = logging.getLogger("scoreboard")
+
+# Shared pool for the independent ESPN requests made during a data refresh
+_refresh_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="nfl_board_refresh")
+
+# Held while a refresh runs; overlapping refreshes are skipped rather than queued
+_refresh_lock = threading.Lock()
+
+
+# Cutoff times in 24-hour HH:MM (or H:MM) format
+_CUTOFF_TIME_RE = re.compile(r"^([01]?\d|2[0-3]):([0-5]\d)$")
+
+
+def _clock_text(dt: datetime) -> str:
+    """12-hour clock time like "1:00 PM"; AM/PM is spelled out since %p is empty or localized in many locales."""
+    return f"{dt.hour % 12 or 12}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+
+
+# Game date/time display formats, e.g. "Sun 10/5 1:00 PM"
+_DATETIME_FORMATTERS = {
+    "time_only": _clock_text,
+    "date_only": lambda dt: f"{dt:%a} {dt.month}/{dt.day}",
+    "short": lambda dt: f"{dt.month}/{dt.day} {_clock_text(dt)}",
+    "full": lambda dt: f"{dt:%a} {dt.month}/{dt.day} {_clock_text(dt)}",
+}
+
+# Text style keyword arguments shared by queued text draws
+_NO_TEXT_STYLE = {}
+_TIE_TEXT_STYLE = {"fillColor": (200, 200, 50)}  # Yellow for tie
+_RESULT_TEXT_STYLES = {
+    "W": {"fillColor": (50, 255, 50)},  # Green for win
+    "L": {"fillColor": (255, 50, 50)},  # Red for loss
+}
+
+
+class NextGameDisplay(NamedTuple):
+    """Next game summary text for a team, e.g. ("Sun 10/5 1:00 PM", "VS BUF")."""
+    game_time: str
+    opponent_text: str
+
+
+class LastGameResult(NamedTuple):
+    """Last game summary text for a team, e.g. ("W", "27-20", "VS DAL")."""
+    result: str
+    score: str
+    opponent: str
+
+
+class _LRUCache(OrderedDict):
+    """
+    OrderedDict that tracks use order: reads and writes mark an entry as most
+    recently used, and inserts beyond maxsize evict the least recently used entry.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
+@lru_cache(maxsize=64)
+def _split_record_comment(record_comment: str) -> Tuple[str, str]:
+    """Split a standing summary like "1st in NFC East" into two uppercase display lines."""
+    parts = record_comment.split(" ", 2)
+    if len(parts) >= 3:
+        return " ".join(parts[:2]).upper(), parts[2].upper()
+    return record_comment.upper(), "---"
+
+
+def _rebind_game_teams(games: List[NFLGame], teams: Dict[str, NFLTeam]) -> List[NFLGame]:
+    """Point each game's teams at the entries in teams, which may have been replaced while the games were parsed."""
+    rebound = []
+    for game in games:
+        home_team = teams.get(game.home_team.team_id, game.home_team)
+        away_team = teams.get(game.away_team.team_id, game.away_team)
+        if home_team is not game.home_team or away_team is not game.away_team:
+            game = dataclasses.replace(game, home_team=home_team, away_team=away_team)
+        rebound.append(game)
+    return rebound
+
+
 class NFLBoardConfig:
     """
     Handles NFL board configuration with validation and sensible defaults.
     Makes configuration logic clear and separate from rendering logic.
     """
 
+    __slots__ = (
+        "team_ids",
+        "team_ids_set",
+        "display_seconds",
+        "refresh_seconds",
+        "max_items",
+        "logo_cache_size",
+        "show_all_games",
+        "show_previous_games_until_time",
+        "cutoff_minutes",
+    )
+
     def __init__(self, config_data: dict):
         # Team configuration - must have at least one team
         self.team_ids = self._parse_team_ids(config_data.get("team_ids", []))
         if not self.team_ids:
             raise ValueError("NFL Board requires at least one team_id in configuration")
+        self.team_ids_set = frozenset(self.team_ids)
 
         # Display timing settings
         self.display_seconds = int(config_data.get("display_seconds", 8))
         self.refresh_seconds = int(config_data.get("refresh_seconds", 300))
 
+        # Maximum number of games shown per display cycle
+        self.max_items = max(1, int(config_data.get("max_items", 32)))
+
+        # Maximum number of decoded team logos kept in memory
+        self.logo_cache_size = max(1, int(config_data.get("logo_cache_size", 64)))
+
         # Game display configuration
         self.show_all_games = bool(config_data.get("show_all_games", False))
         self.show_previous_games_until_time = self._parse_cutoff_time(
             config_data.get("show_previous_games_until", "06:00")
         )
+        # Cutoff as minutes since midnight for cheap integer comparisons
+        self.cutoff_minutes = self.show_previous_games_until_time.hour * 60 + self.show_previous_games_until_time.minute
 
-        debug.info(f"NFL Board: Configured for teams {self.team_ids}")
-        debug.info(f"NFL Board: Show all games = {self.show_all_games}")
-        debug.info(f"NFL Board: Previous games cutoff = {self.show_previous_games_until_time}")
+        debug.info("NFL Board: Configured for teams %s", self.team_ids)
+        debug.info("NFL Board: Show all games = %s", self.show_all_games)
+        debug.info("NFL Board: Previous games cutoff = %s", self.show_previous_games_until_time)
 
     def _parse_team_ids(self, team_ids_config) -> List[str]:
         """Parse team IDs from configuration, handling single string or list."""
@@ -58,15 +184,18 @@ class NFLBoardConfig:
         return parsed_ids
 
     def _parse_cutoff_time(self, time_string: str) -> time:
-        """Parse cutoff time string into time object."""
-        try:
-            hour, minute = map(int, time_string.split(":"))
-            return time(hour, minute)
-        except (ValueError, AttributeError):
+        """Parse cutoff time string (HH:MM) into time object."""
+        match = _CUTOFF_TIME_RE.match(time_string.strip()) if isinstance(time_string, str) else None
+        if not match:
             debug.warning(f"NFL Board: Invalid cutoff time '{time_string}', using 06:00")
             return time(6, 0)
+        return time(int(match.group(1)), int(match.group(2)))
+
+    def is_before_cutoff(self, now: datetime) -> bool:
+        """Check if the given time of day is before the previous games cutoff."""
+        return now.hour * 60 + now.minute < self.cutoff_minutes
 
-    def should_show_previous_game(self, game: NFLGame) -> bool:
+    def should_show_previous_game(self, game: NFLGame, now: datetime, today: date) -> bool:
         """
         Determine if a previous day's game should still be shown.
         Games from yesterday are shown until the configured cutoff time.
@@ -74,12 +203,10 @@ class NFLBoardConfig:
         if not game.is_final:
             return True
 
-        now = datetime.now()
         if not game.date:
             return False
 
         game_date = game.date.date()
-        today = now.date()
 
         # Show games from today or future
         if game_date >= today:
@@ -87,7 +214,7 @@ class NFLBoardConfig:
 
         # Show games from yesterday if we're before the cutoff time
         if game_date == today - timedelta(days=1):
-            return now.time() < self.show_previous_games_until_time
+            return self.is_before_cutoff(now)
 
         # Don't show games older than yesterday
         return False
@@ -101,6 +228,18 @@ class NFLBoard(BoardBase):
     # Class attribute: NFL Board requires early initialization for data fetching
     requires_early_initialization = True
 
+    # Display text for regulation quarters
+    _QUARTER_TEXT = {"1": "1ST", "2": "2ND", "3": "3RD", "4": "4TH"}
+
+    # Layout element names the render methods look for
+    _LAYOUT_ELEMENTS = (
+        "away_team_logo", "home_team_logo", "score", "away_team_score", "home_team_score",
+        "scheduled_date", "scheduled_time", "VS", "game_status",
+        "team_logo", "gradient", "team_name", "record_header", "record", "record_comment",
+        "record_comment_line_1", "next_game_header", "next_game_line_1", "next_game_line_2",
+        "next_game_line_3", "last_game_header", "last_game_result", "last_game_text",
+    )
+
     def __init__(self, data, matrix, sleepEvent):
         super().__init__(data, matrix, sleepEvent)
 
@@ -127,24 +266,48 @@ class NFLBoard(BoardBase):
         )
         self.logo_manager = NFLLogoManager(logo_cache_dir)
 
+        # Layouts resolved on first use: name -> (layout, element names present)
+        self._layouts: Dict[str, Tuple[Optional[object], frozenset]] = {}
+
         # Display state management - unified approach
         self.current_display_items = []  # Unified list of games and team summaries
+        self._display_items_key = None  # (snapshot version, date, before cutoff) the list was built for
+
+        # Formatted game date/time text by (game id, format type); reset whenever the display list is rebuilt
+        self._datetime_text_cache: Dict[Tuple[str, str], str] = {}
+
+        # Logo caching for performance (LRU, bounded by config.logo_cache_size)
+        self.logo_cache: "_LRUCache[str, Image.Image]" = _LRUCache(self.config.logo_cache_size)
+        self._logo_cache_lock = threading.Lock()
+
+        # Zoomed logos keyed by (team abbreviation, zoom percent); only used from the render thread
+        self._zoomed_logo_cache: "_LRUCache[Tuple[str, int], Image.Image]" = _LRUCache(self.config.logo_cache_size)
 
-        # Logo caching for performance
-        self.logo_cache: Dict[str, Image.Image] = {}
+        # Logos + gradient pre-composited into full-frame backgrounds, keyed by view and team abbreviations
+        self._background_cache: "_LRUCache[Tuple[str, ...], Image.Image]" = _LRUCache(self.config.logo_cache_size)
+
+        # Background workers used to warm the logo cache ahead of rendering
+        self._logo_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="nfl_board_logos")
+        # In-flight background loads by cache key, so a logo is only fetched once at a time
+        self._logo_loads: Dict[str, Future] = {}
 
         # Load logo positioning offsets if they exist
         self.logo_offsets = self._load_logo_offsets()
 
         # Gradient used for board
         self.gradient = self._load_gradient()
+        self._gradient_pos_game = (self.matrix.width / 2, 0)
+        self._gradient_pos_summary = (self.matrix.width / 3, 0)
 
         # Set up scheduled data refresh using APScheduler
-        self._scheduled_job_id = f"nfl_board_data_refresh_{id(self)}"
+        # A fixed job ID means a re-created board replaces the previous refresh job instead of adding another
+        self._scheduled_job_id = "nfl_board_data_refresh"
 
         # Perform initial data refresh
-        existing_snapshot = getattr(self.data, "nfl_board_snapshot", None)
-        if existing_snapshot is None:
+        # Make sure the shared snapshot attribute exists so it can be read directly
+        if not hasattr(self.data, "nfl_board_snapshot"):
+            self.data.nfl_board_snapshot = None
+        if self.data.nfl_board_snapshot is None:
             self._perform_data_refresh()
 
         # Schedule recurring data refresh
@@ -164,7 +327,7 @@ class NFLBoard(BoardBase):
             debug.debug("NFL Board: Refreshing display games")
             self._refresh_display_games()
 
-            debug.debug(f"NFL Board: Have {len(self.current_display_items)} total items to display")
+            debug.debug("NFL Board: Have %s total items to display", len(self.current_display_items))
 
             # Check if we have anything to display
             if not self.current_display_items:
@@ -204,60 +367,94 @@ class NFLBoard(BoardBase):
             debug.warning("NFL Board: No scheduler available")
             return
 
-        # Only add job if it doesn't already exist
-        if not scheduler.get_job(self._scheduled_job_id):
-            scheduler.add_job(
-                self._perform_data_refresh,
-                "interval",
-                seconds=self.config.refresh_seconds,
-                id=self._scheduled_job_id,
-                max_instances=1,
-                replace_existing=True,
-            )
-            debug.info(f"NFL Board: Scheduled data refresh every {self.config.refresh_seconds} seconds")
-        else:
-            debug.info("NFL Board: Data refresh job already scheduled")
+        # Single recurring job; missed runs are coalesced rather than stacked
+        scheduler.add_job(
+            self._perform_data_refresh,
+            "interval",
+            seconds=self.config.refresh_seconds,
+            id=self._scheduled_job_id,
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+        )
+        debug.info("NFL Board: Scheduled data refresh every %s seconds", self.config.refresh_seconds)
 
     def _perform_data_refresh(self):
         """
         Complete data refresh with all NFL information.
         Fetches comprehensive data: teams, detailed records, games, and schedules.
+        Skips if another refresh is already in progress.
         """
-        debug.info("NFL Board: Performing data refresh")
+        if not _refresh_lock.acquire(blocking=False):
+            debug.info("NFL Board: Data refresh already in progress, skipping")
+            return
 
         try:
-            # Create new data snapshot
-            snapshot = NFLDataSnapshot()
+            debug.info("NFL Board: Performing data refresh")
+            snapshot = self._build_data_snapshot()
 
+            # Publish the fully built snapshot with a single assignment so render never sees a partial one
+            self.data.nfl_board_snapshot = snapshot
+
+            # Start fetching logos for everything the snapshot can show while render is idle
+            if self._is_snapshot_valid(snapshot):
+                self._prewarm_logos(
+                    [*snapshot.favorite_teams.values(), *snapshot.todays_games, *snapshot.yesterdays_games]
+                )
+        finally:
+            _refresh_lock.release()
+
+    def _build_data_snapshot(self) -> NFLDataSnapshot:
+        """Fetch all data into a new snapshot, or an error snapshot if the refresh fails."""
+        try:
             # Fetch all teams data first
             all_teams = self.api_client.get_all_teams()
             if not all_teams:
+                snapshot = NFLDataSnapshot()
                 snapshot.error_message = "Failed to fetch teams data"
                 debug.error("NFL Board: Failed to fetch teams data")
-                self.data.nfl_board_snapshot = snapshot
-                return
+                return snapshot
 
-            snapshot.all_teams = all_teams
+            # Start from the previous good snapshot so data that fails to refetch is carried forward
+            previous_snapshot = self.data.nfl_board_snapshot
+            if self._is_snapshot_valid(previous_snapshot):
+                snapshot = previous_snapshot.clone()
+            else:
+                snapshot = NFLDataSnapshot()
 
-            # Populate detailed information for ALL teams
-            # This gives us full records, standings info, etc.
-            all_team_ids = list(all_teams.keys())
-            detailed_count = self.api_client.populate_team_details(all_team_ids)
-            debug.debug(f"NFL Board: Loaded detailed data for {detailed_count} total teams")
+            # Populate detailed information (full records, standings info, etc.)
+            # Favorite teams are always refreshed; other teams only once their details expire
+            stale_team_ids = [
+                team_id for team_id in all_teams
+                if team_id in self.config.team_ids_set or self.api_client.team_details_expired(team_id)
+            ]
+            details_future = _refresh_executor.submit(self.api_client.populate_team_details, stale_team_ids)
+
+            # Fetch today's and yesterday's games plus favorite team schedules concurrently
+            today = datetime.now()
+            yesterday = today - timedelta(days=1)
+            todays_future = _refresh_executor.submit(self.api_client.get_scoreboard_for_date, today)
+            yesterdays_future = _refresh_executor.submit(self.api_client.get_scoreboard_for_date, yesterday)
+            schedule_futures = {
+                team_id: _refresh_executor.submit(self.api_client.get_team_schedule, team_id)
+                for team_id in self.config.team_ids
+            }
+
+            detailed_count = details_future.result()
+            debug.debug("NFL Board: Loaded detailed data for %s teams", detailed_count)
+
+            # Copy the client's team cache so later refreshes don't mutate a published snapshot
+            snapshot.all_teams = dict(all_teams)
 
             # Get favorite teams subset (now with detailed records)
             snapshot.favorite_teams = {
-                team_id: team for team_id, team in all_teams.items()
-                if team_id in self.config.team_ids
+                team_id: team for team_id, team in snapshot.all_teams.items()
+                if team_id in self.config.team_ids_set
             }
 
-            # Fetch today's games
-            today = datetime.now()
-            snapshot.todays_games = self.api_client.get_scoreboard_for_date(today)
-
-            # Fetch yesterday's games
-            yesterday = today - timedelta(days=1)
-            snapshot.yesterdays_games = self.api_client.get_scoreboard_for_date(yesterday)
+            # Games were parsed while team details were loading, so they may still hold basic teams
+            snapshot.todays_games = _rebind_game_teams(todays_future.result(), snapshot.all_teams)
+            snapshot.yesterdays_games = _rebind_game_teams(yesterdays_future.result(), snapshot.all_teams)
 
             # Identify live games
             snapshot.live_games = [game for game in snapshot.todays_games if game.is_live]
@@ -267,49 +464,64 @@ class NFLBoard(BoardBase):
             all_recent_games = snapshot.todays_games + snapshot.yesterdays_games
 
             for game in all_recent_games:
-                if any(game.involves_team(team_id) for team_id in self.config.team_ids):
+                if not self.config.team_ids_set.isdisjoint(game.team_ids):
                     favorite_team_games.append(game)
 
             snapshot.favorite_team_games = favorite_team_games
 
             # Get team schedules for favorite teams (for upcoming games)
-            for team_id in self.config.team_ids:
-                team_schedule = self.api_client.get_team_schedule(team_id)
-                snapshot.team_schedules[team_id] = team_schedule
-
-            # Store snapshot for board to use
-            self.data.nfl_board_snapshot = snapshot
+            # A failed fetch returns an empty schedule; keep the previous one in that case
+            for team_id, schedule_future in schedule_futures.items():
+                team_schedule = _rebind_game_teams(schedule_future.result(), snapshot.all_teams)
+                if team_schedule or team_id not in snapshot.team_schedules:
+                    snapshot.team_schedules[team_id] = team_schedule
 
             debug.info(
-                f"NFL Board: Data refresh complete - {len(snapshot.todays_games)} today, "
-                f"{len(snapshot.yesterdays_games)} yesterday, "
-                f"{len(snapshot.favorite_team_games)} favorite team games"
+                "NFL Board: Data refresh complete - %s today, %s yesterday, %s favorite team games",
+                len(snapshot.todays_games),
+                len(snapshot.yesterdays_games),
+                len(snapshot.favorite_team_games),
             )
+            return snapshot
 
         except Exception as error:
             debug.error(f"NFL Board: Data refresh failed: {error}")
-            # Store error snapshot
+            # Return error snapshot
             error_snapshot = NFLDataSnapshot()
             error_snapshot.error_message = f"Data refresh failed: {error}"
-            self.data.nfl_board_snapshot = error_snapshot
-
+            return error_snapshot
 
     def _refresh_display_games(self):
         """Update the unified list of items that should be displayed."""
-        snapshot = getattr(self.data, "nfl_board_snapshot", None)
+        snapshot = self.data.nfl_board_snapshot
         if not self._is_snapshot_valid(snapshot):
             debug.warning("NFL Board: No valid data snapshot available")
             self.current_display_items = []
+            self._display_items_key = None
+            return
+
+        # Capture the current time once for this render pass
+        now = datetime.now()
+        today = now.date()
+
+        # The display list only depends on the snapshot, the date and which side of the cutoff we're on
+        before_cutoff = self.config.is_before_cutoff(now)
+        display_items_key = (snapshot.version, today, before_cutoff)
+        if display_items_key == self._display_items_key:
+            debug.debug("NFL Board: Snapshot unchanged, reusing display items")
             return
 
+        # Game times may have moved in the new snapshot
+        self._datetime_text_cache.clear()
+
         # Get games to display using consolidated logic
-        filtered_games = self._get_games_for_display(snapshot)
+        filtered_games = self._get_games_for_display(snapshot, now, today, before_cutoff)
 
         # Separate favorite team games from other games
         favorite_team_games = []
         other_games = []
         for game in filtered_games:
-            if any(game.involves_team(team_id) for team_id in self.config.team_ids):
+            if not self.config.team_ids_set.isdisjoint(game.team_ids):
                 favorite_team_games.append(game)
             else:
                 other_games.append(game)
@@ -317,10 +529,8 @@ class NFLBoard(BoardBase):
         # Determine which teams should show team summaries instead of games
         teams_with_games_today = set()
         for game in favorite_team_games:
-            if game.date and game.date.date() == datetime.now().date():
-                for team_id in self.config.team_ids:
-                    if game.involves_team(team_id):
-                        teams_with_games_today.add(team_id)
+            if game.date and game.date.date() == today:
+                teams_with_games_today.update(game.team_ids & self.config.team_ids_set)
 
         # Build list of teams to show summaries for (favorite teams without games today)
         teams_for_summaries = []
@@ -335,83 +545,105 @@ class NFLBoard(BoardBase):
         display_items.extend(teams_for_summaries)  # Finally team summaries for teams without games
 
         self.current_display_items = display_items
+        self._display_items_key = display_items_key
 
-        debug.debug(f"NFL Board: Updated unified display - {len(display_items)} total items ")
+        # Warm logos for everything about to be shown so renders don't block on disk
+        self._prewarm_logos(display_items)
+
+        debug.debug("NFL Board: Updated unified display - %s total items ", len(display_items))
         debug.debug(
-            f"NFL Board: {len(favorite_team_games)} favorite games, "
-            f"{len(other_games)} other games, "
-            f"{len(teams_for_summaries)} team summaries"
+            "NFL Board: %s favorite games, %s other games, %s team summaries",
+            len(favorite_team_games),
+            len(other_games),
+            len(teams_for_summaries),
         )
 
-    def _get_games_for_display(self, snapshot: 'NFLDataSnapshot') -> List['NFLGame']:
+    def _get_games_for_display(
+        self, snapshot: 'NFLDataSnapshot', now: datetime, today: date, before_cutoff: bool
+    ) -> List['NFLGame']:
         """
         Get games that should be displayed based on configuration.
         Consolidates all game filtering logic in the board class.
         """
-        games_to_show = []
-
-        # Always include live games involving favorite teams
-        for game in snapshot.live_games:
-            if any(game.involves_team(team_id) for team_id in self.config.team_ids):
-                games_to_show.append(game)
+        # Keep the first max_items games: live first, then by date
+        return heapq.nsmallest(
+            self.config.max_items,
+            self._iter_display_games(snapshot, now, today, before_cutoff),
+            key=lambda g: (not g.is_live, g.date or datetime.min),
+        )
 
-        # Include favorite team games
-        for game in snapshot.favorite_team_games:
-            if game not in games_to_show:
-                games_to_show.append(game)
+    def _iter_display_games(
+        self, snapshot: 'NFLDataSnapshot', now: datetime, today: date, before_cutoff: bool
+    ) -> Iterator['NFLGame']:
+        """Yield each displayable game once, deduplicated by game ID, in source priority order."""
+        favorite_ids = self.config.team_ids_set
 
-        # Include today's games if configured
+        # Candidate sources in priority order, with whether each is limited to favorite teams:
+        # live favorite games, favorite team games, today's games (if configured),
+        # and yesterday's games (if before cutoff time)
+        sources = [(snapshot.live_games, True), (snapshot.favorite_team_games, False)]
         if self.config.show_all_games:
-            for game in snapshot.todays_games:
-                if game not in games_to_show:
-                    games_to_show.append(game)
-
-        # Include yesterday's games if before cutoff time
-        current_time = datetime.now().time()
-        if current_time < self.config.show_previous_games_until_time:
-            for game in snapshot.yesterdays_games:
-                if game not in games_to_show:
-                    games_to_show.append(game)
-
-        # Apply additional filtering for previous games using config rules
-        filtered_games = []
-        for game in games_to_show:
-            if self.config.should_show_previous_game(game):
-                filtered_games.append(game)
-
-        # Sort games: live first, then by date
-        filtered_games.sort(key=lambda g: (not g.is_live, g.date or datetime.min))
-
-        return filtered_games
+            sources.append((snapshot.todays_games, False))
+        if before_cutoff:
+            sources.append((snapshot.yesterdays_games, False))
+
+        # Single pass: dedup by game ID and apply the previous-game rules inline
+        seen = set()
+        for games, favorites_only in sources:
+            for game in games:
+                if game.game_id in seen:
+                    continue
+                if favorites_only and favorite_ids.isdisjoint(game.team_ids):
+                    continue
+                seen.add(game.game_id)
+                if self.config.should_show_previous_game(game, now, today):
+                    yield game
 
     def _is_snapshot_valid(self, snapshot: 'NFLDataSnapshot') -> bool:
         """Check if snapshot has valid data."""
         return snapshot and not snapshot.error_message and bool(snapshot.all_teams)
 
 
+    def _get_layout(self, layout_name: str) -> Tuple[Optional[object], frozenset]:
+        """
+        Get a board layout and the set of element names it defines.
+        Both are resolved once per layout name and reused for every render.
+        """
+        if layout_name in self._layouts:
+            return self._layouts[layout_name]
+
+        layout = self.get_board_layout(layout_name)
+        if not layout:
+            # Don't cache a missing layout; callers fall back and retry next render
+            return None, frozenset()
+
+        elements = frozenset(name for name in self._LAYOUT_ELEMENTS if hasattr(layout, name))
+        self._layouts[layout_name] = (layout, elements)
+        return layout, elements
+
     def _render_live_game(self, game: NFLGame):
         """Render a live game display."""
         debug.debug(
-            f"NFL Board: Rendering live game "
-            f"{game.away_team.abbreviation} @ {game.home_team.abbreviation}"
+            "NFL Board: Rendering live game %s @ %s",
+            game.away_team.abbreviation,
+            game.home_team.abbreviation,
         )
 
         self.matrix.clear()
-        layout = self.get_board_layout('nfl_game')
+        layout, elements = self._get_layout('nfl_game')
 
         if not layout:
             self._render_fallback_game_display(game, "LIVE")
             return
 
         # Render team information
-        self._render_team_display(layout, game, show_scores=True)
+        self._render_team_display(layout, elements, game, show_scores=True)
 
         # Render live game status
-        live_status = self._format_live_game_status(game)
-        quarter, time = live_status.split(" ", 1) if " " in live_status else (live_status, "")
-        if hasattr(layout, 'scheduled_date'):
+        quarter, time = self._format_live_game_status(game)
+        if 'scheduled_date' in elements:
             self.matrix.draw_text_layout(layout.scheduled_date, quarter)
-        if hasattr(layout, "scheduled_time") and time:
+        if 'scheduled_time' in elements and time:
             self.matrix.draw_text_layout(layout.scheduled_time, time)
 
         # Render to the display
@@ -423,22 +655,23 @@ class NFLBoard(BoardBase):
     def _render_completed_game(self, game: NFLGame):
         """Render a completed game display."""
         debug.debug(
-            f"NFL Board: Rendering completed game "
-            f"{game.away_team.abbreviation} @ {game.home_team.abbreviation}"
+            "NFL Board: Rendering completed game %s @ %s",
+            game.away_team.abbreviation,
+            game.home_team.abbreviation,
         )
 
         self.matrix.clear()
-        layout = self.get_board_layout('nfl_game')
+        layout, elements = self._get_layout('nfl_game')
 
         if not layout:
             self._render_fallback_game_display(game, "FINAL")
             return
 
         # Render team information with final scores
-        self._render_team_display(layout, game, show_scores=True)
+        self._render_team_display(layout, elements, game, show_scores=True)
 
         # Render final status
-        if hasattr(layout, 'scheduled_date'):
+        if 'scheduled_date' in elements:
             self.matrix.draw_text_layout(layout.scheduled_date, "FINAL")
 
         # Render to the display
@@ -450,12 +683,13 @@ class NFLBoard(BoardBase):
     def _render_upcoming_game(self, game: NFLGame):
         """Render an upcoming game display."""
         debug.debug(
-            f"NFL Board: Rendering upcoming game "
-            f"{game.away_team.abbreviation} @ {game.home_team.abbreviation}"
+            "NFL Board: Rendering upcoming game %s @ %s",
+            game.away_team.abbreviation,
+            game.home_team.abbreviation,
         )
 
         self.matrix.clear()
-        layout = self.get_board_layout('nfl_game')
+        layout, elements = self._get_layout('nfl_game')
 
         if not layout:
             debug.warning("NFL Board: Couldn't find layout, falling back to default layout")
@@ -463,19 +697,19 @@ class NFLBoard(BoardBase):
             return
 
         # Render team information with records instead of scores
-        self._render_team_display(layout, game, show_scores=False)
+        self._render_team_display(layout, elements, game, show_scores=False)
 
         # Render game date/time
-        if hasattr(layout, 'scheduled_date'):
+        if 'scheduled_date' in elements:
             self.matrix.draw_text_layout(layout.scheduled_date, "TODAY")
-        if hasattr(layout, "scheduled_time"):
+        if 'scheduled_time' in elements:
             self.matrix.draw_text_layout(
                 layout.scheduled_time,
                 self._format_game_datetime(game, format_type="time_only")
             )
 
         # VS
-        if hasattr(layout, "VS"):
+        if 'VS' in elements:
             self.matrix.draw_text_layout(layout.VS, "VS")
 
         # Render to the display
@@ -484,21 +718,10 @@ class NFLBoard(BoardBase):
         # Display the rendered content for configured duration
         self.sleepEvent.wait(self.config.display_seconds)
 
-    def _render_team_display(self, layout, game: NFLGame, show_scores: bool):
+    def _render_team_display(self, layout, elements: frozenset, game: NFLGame, show_scores: bool):
         """Render team information (logos, names, scores/records)."""
-        # Render team logos
-        if hasattr(layout, 'away_team_logo'):
-            away_logo = self._get_team_logo(game.away_team)
-            if away_logo:
-                self._draw_logo(layout, "away_team_logo", away_logo, game.away_team.abbreviation)
-
-        if hasattr(layout, 'home_team_logo'):
-            home_logo = self._get_team_logo(game.home_team)
-            if home_logo:
-                self._draw_logo(layout, "home_team_logo", home_logo, game.home_team.abbreviation)
-
-        # Render gradient - after logos but before other visuals
-        self.matrix.draw_image([self.matrix.width/2,0], self.gradient, align="center")
+        # Render team logos and gradient from the pre-composited background
+        self.matrix.draw_image((0, 0), self._get_game_background(layout, elements, game))
 
         # Render team names
         # if hasattr(layout, 'away_team_name'):
@@ -509,24 +732,24 @@ class NFLBoard(BoardBase):
 
         # Render scores or records
         if show_scores:
-            if hasattr(layout, 'score'):
+            if 'score' in elements:
                 self.matrix.draw_text_layout(layout.score, str(f"{game.away_score}-{game.home_score}"))
         else:
-            if hasattr(layout, 'away_team_score'):
+            if 'away_team_score' in elements:
                 self.matrix.draw_text_layout(layout.away_team_score, game.away_team.record_text)
-            if hasattr(layout, 'home_team_score'):
+            if 'home_team_score' in elements:
                 self.matrix.draw_text_layout(layout.home_team_score, game.home_team.record_text)
 
     def _render_team_summary(self, team: NFLTeam):
         """Render team summary display showing team info, record, next/last games."""
-        debug.debug(f"NFL Board: Rendering team summary for {team.display_name}")
-        debug.debug(f"NFL Board: Team record: {team.record_text} (detailed: {team.has_detailed_record})")
-        debug.debug(f"NFL Board: Team colors: {team.color_primary}, {team.color_secondary}")
+        debug.debug("NFL Board: Rendering team summary for %s", team.display_name)
+        debug.debug("NFL Board: Team record: %s (detailed: %s)", team.record_text, team.has_detailed_record)
+        debug.debug("NFL Board: Team colors: %s, %s", team.color_primary, team.color_secondary)
 
         if not team.has_detailed_record:
             debug.warning(f"NFL Board: Team {team.display_name} using basic data - detailed record not loaded")
 
-        layout = self.get_board_layout('nfl_team_summary')
+        layout, elements = self._get_layout('nfl_team_summary')
 
         if not layout:
             debug.warning("NFL Board: No team summary layout found, using fallback")
@@ -535,97 +758,75 @@ class NFLBoard(BoardBase):
 
         # Check if content needs scrolling (64x32 displays)
         if self.matrix.height <= 32:
-            self._render_team_summary_scrolling(team, layout)
+            self._render_team_summary_scrolling(team, layout, elements)
         else:
-            self._render_team_summary_static(team, layout)
+            self._render_team_summary_static(team, layout, elements)
 
-    def _render_team_summary_static(self, team: NFLTeam, layout):
+    def _render_team_summary_static(self, team: NFLTeam, layout, elements: frozenset):
         """Render team summary for larger displays (128x64) - no scrolling needed."""
         debug.debug("NFL Board: Using static team summary layout")
 
         self.matrix.clear()
 
         # Get team's schedule data for next/last game info
-        snapshot = getattr(self.data, "nfl_board_snapshot", None)
+        snapshot = self.data.nfl_board_snapshot
         team_schedule = []
         if snapshot and team.team_id in snapshot.team_schedules:
             team_schedule = snapshot.team_schedules[team.team_id]
 
         # Render team logo
-        if hasattr(layout, 'team_logo'):
+        if 'team_logo' in elements:
             team_logo = self._get_team_logo(team)
             if team_logo:
                 self._draw_logo(layout, 'team_logo', team_logo, team.abbreviation)
 
         # Render gradient - after logos but before other visuals
-        self.matrix.draw_image([self.matrix.width/3,0], self.gradient, align="center")
+        self.matrix.draw_image(self._gradient_pos_summary, self.gradient, align="center")
+
+        # Queue text draws and issue them together once all content is known
+        team_colors = {"fillColor": team.color_primary, "backgroundColor": team.color_secondary}
+        text_batch = []
 
         # Render team name with team colors
-        if hasattr(layout, 'team_name'):
-            self.matrix.draw_text_layout(
-                layout.team_name,
-                team.display_name,
-                fillColor=team.color_primary,
-                backgroundColor=team.color_secondary
-            )
+        if 'team_name' in elements:
+            text_batch.append((layout.team_name, team.display_name, team_colors))
 
         # Render record
-        if hasattr(layout, 'record_header'):
-            debug.debug("NFL Board: Rendering record header")
-            self.matrix.draw_text_layout(
-                layout.record_header,
-                "RECORD:",
-                fillColor=team.color_primary,
-                backgroundColor=team.color_secondary
-            )
-        if hasattr(layout, 'record'):
-            debug.debug(f"NFL Board: Rendering record: {team.record_text}")
-            self._draw_text(layout, "record", team.record_text)
-        if hasattr(layout, 'record_comment') and team.record_comment:
-            debug.debug(f"NFL Board: Rendering record comment: {team.record_comment}")
-            self._draw_text(layout, "record_comment", team.record_comment.upper())
+        if 'record_header' in elements:
+            text_batch.append((layout.record_header, "RECORD:", team_colors))
+        if 'record' in elements:
+            text_batch.append((layout.record, team.record_text, _NO_TEXT_STYLE))
+        if 'record_comment' in elements and team.record_comment:
+            text_batch.append((layout.record_comment, team.record_comment.upper(), _NO_TEXT_STYLE))
 
         # Render next game section
         next_game = self._get_next_game_for_team(team.team_id, team_schedule)
-        if hasattr(layout, 'next_game_header'):
-            self.matrix.draw_text_layout(
-                layout.next_game_header,
-                "NEXT GAME:",
-                fillColor=team.color_primary,
-                backgroundColor=team.color_secondary
-            )
+        if 'next_game_header' in elements:
+            text_batch.append((layout.next_game_header, "NEXT GAME:", team_colors))
 
         date = self._format_game_datetime(next_game, format_type="date_only")
         time = self._format_game_datetime(next_game, format_type="time_only")
-        opponent = self._format_next_game_display(next_game, team.team_id).get("opponent_text", "").upper()
+        opponent = self._format_next_game_display(next_game, team.team_id).opponent_text
 
-        if hasattr(layout, 'next_game_line_1'):
-            self.matrix.draw_text_layout(layout.next_game_line_1, date.upper())
-        if hasattr(layout, 'next_game_line_2'):
-            self.matrix.draw_text_layout(layout.next_game_line_2, f"{time.upper()} {opponent.upper()}")
+        if 'next_game_line_1' in elements:
+            text_batch.append((layout.next_game_line_1, date.upper(), _NO_TEXT_STYLE))
+        if 'next_game_line_2' in elements:
+            text_batch.append((layout.next_game_line_2, " ".join((time, opponent)), _NO_TEXT_STYLE))
 
         # Render last game information
         last_game = self._get_last_game_for_team(team.team_id, team_schedule)
         last_game_results = self._format_last_game_display(last_game, team.team_id)
-        if hasattr(layout, 'last_game_header'):
-            self.matrix.draw_text_layout(
-                layout.last_game_header,
-                "LAST GAME:",
-                fillColor=team.color_primary,
-                backgroundColor=team.color_secondary
-            )
-        if hasattr(layout, 'last_game_result'):
-            result = last_game_results.get("result", "")
-            if result == "W":
-                fillColor = (50, 255, 50)  # Green for win
-            elif result == "L":
-                fillColor = (255, 50, 50)  # Red for loss
-            else:
-                fillColor = (200, 200, 50)  # Yellow for tie
-            self.matrix.draw_text_layout(layout.last_game_result, result.upper(),fillColor=fillColor)
-        if hasattr(layout, 'last_game_text'):
-            last_game_text = f"{last_game_results.get('score', '')} {last_game_results.get('opponent', '')}".strip()
-            self.matrix.draw_text_layout(layout.last_game_text, last_game_text.upper())
+        if 'last_game_header' in elements:
+            text_batch.append((layout.last_game_header, "LAST GAME:", team_colors))
+        if 'last_game_result' in elements:
+            result = last_game_results.result
+            result_style = _RESULT_TEXT_STYLES.get(result, _TIE_TEXT_STYLE)
+            text_batch.append((layout.last_game_result, result, result_style))
+        if 'last_game_text' in elements:
+            last_game_text = " ".join(part for part in (last_game_results.score, last_game_results.opponent) if part)
+            text_batch.append((layout.last_game_text, last_game_text, _NO_TEXT_STYLE))
+
+        self._draw_text_batch(self.matrix, text_batch)
 
         # Render to the display
         self.matrix.render()
@@ -633,12 +834,12 @@ class NFLBoard(BoardBase):
         # Display the rendered content for configured duration
         self.sleepEvent.wait(self.config.display_seconds)
 
-    def _render_team_summary_scrolling(self, team: NFLTeam, layout):
+    def _render_team_summary_scrolling(self, team: NFLTeam, layout, elements: frozenset):
         """Render team summary with scrolling for small displays (64x32)."""
         debug.debug("NFL Board: Using scrolling team summary layout for 64x32")
 
         # Get team's schedule data
-        snapshot = getattr(self.data, "nfl_board_snapshot", None)
+        snapshot = self.data.nfl_board_snapshot
         team_schedule = []
         if snapshot and team.team_id in snapshot.team_schedules:
             team_schedule = snapshot.team_schedules[team.team_id]
@@ -647,70 +848,50 @@ class NFLBoard(BoardBase):
         content_height = 80
         buffer = self.matrix.create_offscreen_buffer(height=content_height)
 
+        # Queue text draws and issue them together once all content is known
+        team_colors = {"fillColor": team.color_primary, "backgroundColor": team.color_secondary}
+        text_batch = []
+
         # Render record section
-        if hasattr(layout, 'record_header'):
-            buffer.draw_text_layout(
-                layout.record_header,
-                "RECORD:",
-                fillColor=team.color_primary,
-                backgroundColor=team.color_secondary
-            )
-        if hasattr(layout, 'record'):
-            buffer.draw_text_layout(layout.record, team.record_text)
-        if hasattr(layout, 'record_comment_line_1') and team.record_comment:
-            parts = team.record_comment.split(" ", 2)
-            if len(parts) >= 3:
-                line1 = " ".join(parts[:2]).upper()
-                line2 = parts[2].upper()
-            else:
-                line1 = team.record_comment.upper()
-                line2 = "---"
-            buffer.draw_text_layout(layout.record_comment_line_1, line1)
-            buffer.draw_text_layout(layout.record_comment_line_2, line2)
+        if 'record_header' in elements:
+            text_batch.append((layout.record_header, "RECORD:", team_colors))
+        if 'record' in elements:
+            text_batch.append((layout.record, team.record_text, _NO_TEXT_STYLE))
+        if 'record_comment_line_1' in elements and team.record_comment:
+            line1, line2 = _split_record_comment(team.record_comment)
+            text_batch.append((layout.record_comment_line_1, line1, _NO_TEXT_STYLE))
+            text_batch.append((layout.record_comment_line_2, line2, _NO_TEXT_STYLE))
 
         # Render next game section
         next_game = self._get_next_game_for_team(team.team_id, team_schedule)
-        if hasattr(layout, 'next_game_header'):
-            buffer.draw_text_layout(
-                layout.next_game_header,
-                "NEXT GAME:",
-                fillColor=team.color_primary,
-                backgroundColor=team.color_secondary
-            )
+        if 'next_game_header' in elements:
+            text_batch.append((layout.next_game_header, "NEXT GAME:", team_colors))
 
         date = self._format_game_datetime(next_game, format_type="date_only")
         time = self._format_game_datetime(next_game, format_type="time_only")
-        opponent = self._format_next_game_display(next_game, team.team_id).get("opponent_text", "").upper()
+        opponent = self._format_next_game_display(next_game, team.team_id).opponent_text
 
-        if hasattr(layout, 'next_game_line_1'):
-            buffer.draw_text_layout(layout.next_game_line_1, date)
-        if hasattr(layout, 'next_game_line_2'):
-            buffer.draw_text_layout(layout.next_game_line_2, time)
-        if hasattr(layout, 'next_game_line_3'):
-            buffer.draw_text_layout(layout.next_game_line_3, opponent)
+        if 'next_game_line_1' in elements:
+            text_batch.append((layout.next_game_line_1, date, _NO_TEXT_STYLE))
+        if 'next_game_line_2' in elements:
+            text_batch.append((layout.next_game_line_2, time, _NO_TEXT_STYLE))
+        if 'next_game_line_3' in elements:
+            text_batch.append((layout.next_game_line_3, opponent, _NO_TEXT_STYLE))
 
         # Render last game section
         last_game = self._get_last_game_for_team(team.team_id, team_schedule)
         last_game_results = self._format_last_game_display(last_game, team.team_id)
-        if hasattr(layout, 'last_game_header'):
-            buffer.draw_text_layout(
-                layout.last_game_header,
-                "LAST GAME:",
-                fillColor=team.color_primary,
-                backgroundColor=team.color_secondary
-            )
-        if hasattr(layout, 'last_game_result'):
-            result = last_game_results.get("result", "")
-            if result == "W":
-                fillColor = (50, 255, 50)
-            elif result == "L":
-                fillColor = (255, 50, 50)
-            else:
-                fillColor = (200, 200, 50)
-            buffer.draw_text_layout(layout.last_game_result, result.upper(), fillColor=fillColor)
-            buffer.draw_text_layout(layout.last_game_score, last_game_results.get('score', '').upper())
-        if hasattr(layout, 'last_game_text'):
-            buffer.draw_text_layout(layout.last_game_text, last_game_results.get('opponent', '').upper())
+        if 'last_game_header' in elements:
+            text_batch.append((layout.last_game_header, "LAST GAME:", team_colors))
+        if 'last_game_result' in elements:
+            result = last_game_results.result
+            result_style = _RESULT_TEXT_STYLES.get(result, _TIE_TEXT_STYLE)
+            text_batch.append((layout.last_game_result, result, result_style))
+            text_batch.append((layout.last_game_score, last_game_results.score, _NO_TEXT_STYLE))
+        if 'last_game_text' in elements:
+            text_batch.append((layout.last_game_text, last_game_results.opponent, _NO_TEXT_STYLE))
+
+        self._draw_text_batch(buffer, text_batch)
 
         # Get the rendered image from buffer
         scrolling_image = buffer.get_image()
@@ -724,15 +905,11 @@ class NFLBoard(BoardBase):
         # Show top of content
         self.matrix.clear()
 
-        # Render team logo
-        if hasattr(layout, 'team_logo'):
-            team_logo = self._get_team_logo(team)
-            if team_logo:
-                self._draw_logo(layout, 'team_logo', team_logo, team.abbreviation)
-                # Render gradient - after logos but before other visuals
-                if hasattr(layout, 'gradient'):
-                    self.matrix.draw_image_layout(layout.gradient, self.gradient)
+        # Team logo and gradient are composited once and redrawn as a single image per frame
+        background = self._get_summary_background(layout, elements, team)
 
+        if background:
+            self.matrix.draw_image((0, 0), background)
         self.matrix.draw_image((0, y_offset), scrolling_image)
         self.matrix.render()
         self.sleepEvent.wait(2)  # Hold at top for 2 seconds
@@ -741,14 +918,8 @@ class NFLBoard(BoardBase):
         while y_offset > -(content_height - self.matrix.height) and not self.sleepEvent.is_set():
             y_offset -= 1
             self.matrix.clear()
-            # Render team logo
-            if hasattr(layout, 'team_logo'):
-                team_logo = self._get_team_logo(team)
-                if team_logo:
-                    self._draw_logo(layout, 'team_logo', team_logo, team.abbreviation)
-                    # Render gradient - after logos but before other visuals
-                    if hasattr(layout, 'gradient'):
-                        self.matrix.draw_image_layout(layout.gradient, self.gradient)
+            if background:
+                self.matrix.draw_image((0, 0), background)
             self.matrix.draw_image((0, y_offset), scrolling_image)
             self.matrix.render()
             self.sleepEvent.wait(0.15)  # Scroll speed
@@ -761,9 +932,9 @@ class NFLBoard(BoardBase):
         debug.debug("NFL Board: Rendering no content available message")
 
         self.matrix.clear()
-        layout = self.get_board_layout('nfl_game')
+        layout, elements = self._get_layout('nfl_game')
 
-        if layout and hasattr(layout, 'game_status'):
+        if layout and 'game_status' in elements:
             self.matrix.draw_text_layout(layout.game_status, "No NFL Content")
         else:
             # Fallback to centered text
@@ -778,12 +949,12 @@ class NFLBoard(BoardBase):
 
     def _render_error_display(self, error_message: str):
         """Render error message display."""
-        debug.debug(f"NFL Board: Rendering error display: {error_message}")
+        debug.debug("NFL Board: Rendering error display: %s", error_message)
 
         self.matrix.clear()
-        layout = self.get_board_layout('nfl')
+        layout, elements = self._get_layout('nfl')
 
-        if layout and hasattr(layout, 'game_status'):
+        if layout and 'game_status' in elements:
             self.matrix.draw_text_layout(layout.game_status, "NFL Error")
         else:
             # Fallback to centered text
@@ -815,30 +986,167 @@ class NFLBoard(BoardBase):
         # Display the rendered content for configured duration
         self.sleepEvent.wait(self.config.display_seconds)
 
+    def _get_game_background(self, layout, elements: frozenset, game: NFLGame) -> Image.Image:
+        """
+        Get both team logos with the gradient over them as one full-frame image.
+        Built on an offscreen buffer and cached once both logos are available.
+        """
+        cache_key = ("game", game.away_team.abbreviation, game.home_team.abbreviation)
+        background = self._background_cache.get(cache_key)
+        if background is not None:
+            return background
+
+        buffer = self.matrix.create_offscreen_buffer(height=self.matrix.height)
+        complete = True
+        for element_name, team in (("away_team_logo", game.away_team), ("home_team_logo", game.home_team)):
+            if element_name not in elements:
+                continue
+            logo = self._get_team_logo(team)
+            if logo:
+                self._draw_logo(layout, element_name, logo, team.abbreviation, canvas=buffer)
+            else:
+                complete = False
+
+        # Render gradient - after logos but before other visuals
+        buffer.draw_image(self._gradient_pos_game, self.gradient, align="center")
+        background = buffer.get_image()
+
+        # Don't cache a background missing a logo that may still be downloading
+        if complete:
+            self._background_cache[cache_key] = background
+        return background
+
+    def _get_summary_background(self, layout, elements: frozenset, team: NFLTeam) -> Optional[Image.Image]:
+        """
+        Get the team logo with the gradient over it as one full-frame image for the scrolling summary.
+        Returns None when the layout has no logo or the logo isn't available.
+        """
+        if 'team_logo' not in elements:
+            return None
+
+        cache_key = ("summary", team.abbreviation)
+        background = self._background_cache.get(cache_key)
+        if background is not None:
+            return background
+
+        team_logo = self._get_team_logo(team)
+        if not team_logo:
+            return None
+
+        buffer = self.matrix.create_offscreen_buffer(height=self.matrix.height)
+        self._draw_logo(layout, 'team_logo', team_logo, team.abbreviation, canvas=buffer)
+        # Render gradient - after logos but before other visuals
+        if 'gradient' in elements:
+            buffer.draw_image_layout(layout.gradient, self.gradient)
+        background = buffer.get_image()
+
+        self._background_cache[cache_key] = background
+        return background
+
+    def _prewarm_logos(self, items: List) -> None:
+        """Queue background loads for logos of all teams in the display items that aren't cached yet."""
+        teams = {}
+        for item in items:
+            if isinstance(item, NFLGame):
+                teams[item.home_team.abbreviation] = item.home_team
+                teams[item.away_team.abbreviation] = item.away_team
+            elif isinstance(item, NFLTeam):
+                teams[item.abbreviation] = item
+
+        submitted = []
+        with self._logo_cache_lock:
+            for team in teams.values():
+                cache_key = f"{team.abbreviation}_logo"
+                if cache_key in self.logo_cache or cache_key in self._logo_loads:
+                    continue
+                try:
+                    future = self._logo_executor.submit(self._load_team_logo, team)
+                except RuntimeError:
+                    # Executor already shut down by cleanup()
+                    break
+                self._logo_loads[cache_key] = future
+                submitted.append((cache_key, future))
+
+        # Attached outside the lock: a load that already finished runs its callback right here
+        for cache_key, future in submitted:
+            future.add_done_callback(lambda done, key=cache_key: self._forget_logo_load(key, done))
+
+    def _forget_logo_load(self, cache_key: str, future: Future) -> None:
+        """Drop a finished background logo load from the pending loads."""
+        with self._logo_cache_lock:
+            if self._logo_loads.get(cache_key) is future:
+                del self._logo_loads[cache_key]
+
     def _get_team_logo(self, team: NFLTeam) -> Optional[Image.Image]:
         """Get team logo image with caching and automatic downloading."""
         cache_key = f"{team.abbreviation}_logo"
 
-        if cache_key in self.logo_cache:
-            return self.logo_cache[cache_key]
+        with self._logo_cache_lock:
+            if cache_key in self.logo_cache:
+                return self.logo_cache[cache_key]
+            pending = self._logo_loads.get(cache_key)
 
+        # A background load is already fetching this logo; wait for it instead of downloading it twice
+        if pending is not None:
+            return pending.result()
+
+        return self._load_team_logo(team)
+
+    def _load_team_logo(self, team: NFLTeam) -> Optional[Image.Image]:
+        """Resolve, download if needed and decode a team logo into the logo cache."""
+        cache_key = f"{team.abbreviation}_logo"
         try:
             # Use the logo manager for logo path resolution and download functionality
             logo_path = self.logo_manager.get_team_logo_path(team, size=128, download_if_missing=True)
 
             if logo_path and logo_path.exists():
-                logo_image = Image.open(logo_path)
-                self.logo_cache[cache_key] = logo_image
-                debug.debug(f"NFL Board: Loaded logo for {team.abbreviation} from {logo_path}")
+                logo_image = self._decode_logo(logo_path)
+                with self._logo_cache_lock:
+                    self.logo_cache[cache_key] = logo_image
+                debug.debug("NFL Board: Loaded logo for %s from %s", team.abbreviation, logo_path)
                 return logo_image
 
-            debug.debug(f"NFL Board: No logo available for {team.abbreviation} (URL: {team.logo_url})")
+            debug.debug("NFL Board: No logo available for %s (URL: %s)", team.abbreviation, team.logo_url)
 
         except Exception as error:
             debug.error(f"NFL Board: Failed to load logo for {team.abbreviation}: {error}")
 
         return None
 
+    def _logo_max_dimension(self) -> int:
+        """Largest logo edge that fits the current matrix size."""
+        return 64 if self.matrix.height >= 48 else min(32, self.matrix.height)
+
+    def _decode_logo(self, logo_path: Path) -> Image.Image:
+        """
+        Decode a logo file once into a display-ready image: RGBA and already
+        scaled to the matrix's logo size, so draws don't convert or resize it.
+        """
+        with Image.open(logo_path) as source:
+            logo = source.convert("RGBA")
+
+        max_dimension = self._logo_max_dimension()
+        if max(logo.size) > max_dimension:
+            logo.thumbnail((max_dimension, max_dimension), self._thumbnail_filter(max_dimension))
+        return logo
+
+    def _get_zoomed_logo(self, logo: Image.Image, team_abbreviation: str, zoom: float) -> Image.Image:
+        """Get a zoomed copy of a team logo from the LRU cache, resampling it on a miss."""
+        w, h = logo.size
+        size = (max(1, int(round(w * zoom))), max(1, int(round(h * zoom))))
+        if size == logo.size:
+            # Zoom too small to change the pixel size; nothing to resample
+            return logo
+
+        cache_key = (team_abbreviation, round(zoom * 100))
+        zoomed = self._zoomed_logo_cache.get(cache_key)
+        if zoomed is not None:
+            return zoomed
+
+        zoomed = logo.resize(size, self._thumbnail_filter(max(size)))
+        self._zoomed_logo_cache[cache_key] = zoomed
+        return zoomed
+
     def _draw_logo(self, layout, element_name: str, logo: Image, team_abbreviation: str, canvas=None) -> None:
         """
         Draw a team logo using element-specific offsets.
@@ -850,7 +1158,8 @@ class NFLBoard(BoardBase):
             team_abbreviation: Team abbreviation for offset lookup
             canvas: Optional canvas to draw on (defaults to main matrix)
         """
-        if not hasattr(layout, element_name) or not logo:
+        element = getattr(layout, element_name, None)
+        if element is None or not logo:
             return
 
         if not canvas:
@@ -862,37 +1171,50 @@ class NFLBoard(BoardBase):
         zoom = float(offsets.get("zoom", 1.0))
         offset_x, offset_y = offsets.get("offset", (0, 0))
 
-        # Scale logo to appropriate size
-        max_dimension = 64 if self.matrix.height >= 48 else min(32, self.matrix.height)
-
-        if max(logo.size) > max_dimension:
-            logo.thumbnail((max_dimension, max_dimension), self._thumbnail_filter())
+        # Logos from _get_team_logo are already scaled to the matrix size by _decode_logo
 
-        # Apply zoom if needed
+        # Apply zoom if needed (resampled once per team and zoom level, then reused)
         if zoom != 1.0:
-            w, h = logo.size
-            zoomed = logo.resize(
-                (max(1, int(round(w * zoom))), max(1, int(round(h * zoom)))),
-                self._thumbnail_filter(),
-            )
-            logo = zoomed
+            logo = self._get_zoomed_logo(logo, team_abbreviation, zoom)
 
-        # Apply offset to layout element
-        element = getattr(layout, element_name).__copy__()
-        x, y = element.position
-        element.position = (x + offset_x, y + offset_y)
+        if not (offset_x or offset_y):
+            canvas.draw_image_layout(element, logo)
+            return
 
-        canvas.draw_image_layout(element, logo)
+        # Shift the shared layout element just for this draw, then put it back
+        position = element.position
+        element.position = (position[0] + offset_x, position[1] + offset_y)
+        try:
+            canvas.draw_image_layout(element, logo)
+        finally:
+            element.position = position
 
     @staticmethod
-    def _thumbnail_filter():
-        resampling = getattr(getattr(Image, "Resampling", Image), "LANCZOS", None)
+    def _thumbnail_filter(target_px: int):
+        """
+        Pick the resampling filter for a target logo size.
+        Small (<=32px) targets use BILINEAR, where LANCZOS adds cost without visible benefit.
+        """
+        resampling_enum = getattr(Image, "Resampling", Image)
+        if target_px <= 32:
+            return getattr(resampling_enum, "BILINEAR", Image.BILINEAR)
+
+        resampling = getattr(resampling_enum, "LANCZOS", None)
         if resampling is None:
             resampling = getattr(Image, "LANCZOS", getattr(Image, "ANTIALIAS", Image.BICUBIC))
         return resampling
 
     def _get_logo_offsets(self, team_abbreviation: str, element_name: str) -> dict:
-        """Get logo offsets for a team and element, with fallback hierarchy."""
+        """Get logo offsets for a team and element, memoized per (team, element)."""
+        cache_key = (team_abbreviation, element_name)
+        offsets = self._logo_offsets_cache.get(cache_key)
+        if offsets is None:
+            offsets = self._resolve_logo_offsets(team_abbreviation, element_name)
+            self._logo_offsets_cache[cache_key] = offsets
+        return offsets
+
+    def _resolve_logo_offsets(self, team_abbreviation: str, element_name: str) -> dict:
+        """Resolve logo offsets for a team and element, with fallback hierarchy."""
         team_offsets = self.logo_offsets.get(team_abbreviation.upper())
 
         if isinstance(team_offsets, dict):
@@ -908,21 +1230,22 @@ class NFLBoard(BoardBase):
 
     def _load_logo_offsets(self) -> Dict[str, Dict[str, any]]:
         """Load logo positioning offsets from configuration file."""
+        # Resolved offsets depend on the loaded file, so start a fresh memo
+        self._logo_offsets_cache: Dict[Tuple[str, str], dict] = {}
+
         try:
             offsets_path = self._get_board_directory() / "logo_offsets.json"
 
             if offsets_path.exists():
-                with offsets_path.open() as file:
-                    raw_offsets = json.load(file)
+                raw_offsets = _json.loads(offsets_path.read_bytes())
 
                 # Process offsets with defaults
                 default_offset = raw_offsets.get("_default", {"zoom": 1.0, "offset": (0, 0)})
-                processed_offsets = {}
-
-                for key, value in raw_offsets.items():
-                    if key != "_default":
-                        processed_offsets[key.upper()] = {**default_offset, **value}
-
+                processed_offsets = {
+                    key.upper(): {**default_offset, **value}
+                    for key, value in raw_offsets.items()
+                    if key != "_default"
+                }
                 processed_offsets["_default"] = default_offset
                 return processed_offsets
 
@@ -931,127 +1254,99 @@ class NFLBoard(BoardBase):
 
         return {"_default": {"zoom": 1.0, "offset": (0, 0)}}
 
-    def _format_live_game_status(self, game: NFLGame) -> str:
-        """Format status text for live games."""
+    def _format_live_game_status(self, game: NFLGame) -> Tuple[str, str]:
+        """Format status text for live games as (quarter text, time remaining)."""
         # check if quarter is 1-4 and set as 1ST, 2ND, 3RD, 4TH
-        if game.quarter in ["1", "2", "3", "4"]:
-            quarter_suffix = {"1": "ST", "2": "ND", "3": "RD", "4": "TH"}.get(game.quarter, "TH")
-            quarter_text = f"{game.quarter}{quarter_suffix}"
-        else:
+        quarter_text = self._QUARTER_TEXT.get(game.quarter)
+        if quarter_text is None:
             quarter_text = f"Q{game.quarter}" if game.quarter else "LIVE"
 
         if game.quarter and game.time_remaining:
-            return f"{quarter_text} {game.time_remaining}"
+            return quarter_text, game.time_remaining
         elif game.quarter:
-            return f"{quarter_text}"
+            return quarter_text, ""
         else:
-            return "LIVE"
+            return "LIVE", ""
 
     def _format_game_datetime(self, game: NFLGame, format_type: str = "full") -> str:
         """Format game date and time for display."""
         if not game.date:
             return "TBD"
-        local_dt = game.date.astimezone()
-
-        if format_type == "time_only":
-            hour = local_dt.hour % 12 or 12
-            minute = local_dt.minute
-            ampm = "AM" if local_dt.hour < 12 else "PM"
-            return f"{hour}:{minute:02d} {ampm}"
-        elif format_type == "date_only":
-            return f"{local_dt.strftime('%a')} {local_dt.month}/{local_dt.day}"
-        elif format_type == "short":
-            hour = local_dt.hour % 12 or 12
-            minute = local_dt.minute
-            ampm = "AM" if local_dt.hour < 12 else "PM"
-            return f"{local_dt.month}/{local_dt.day} {hour}:{minute:02d} {ampm}"
-        else:  # "full" (default)
-            weekday = local_dt.strftime("%a")
-            hour = local_dt.hour % 12 or 12
-            minute = local_dt.minute
-            ampm = "AM" if local_dt.hour < 12 else "PM"
-            return f"{weekday} {local_dt.month}/{local_dt.day} {hour}:{minute:02d} {ampm}"
+
+        cache_key = (game.game_id, format_type)
+        text = self._datetime_text_cache.get(cache_key)
+        if text is None:
+            local_dt = game.date.astimezone()
+            text = _DATETIME_FORMATTERS.get(format_type, _DATETIME_FORMATTERS["full"])(local_dt)
+            self._datetime_text_cache[cache_key] = text
+        return text
 
     def _get_next_game_for_team(self, team_id: str, team_schedule: List[NFLGame]) -> Optional[NFLGame]:
         """Find the next upcoming game for a specific team."""
         now = datetime.now(timezone.utc)  # Make timezone-aware
-        upcoming_games = []
-
-        for game in team_schedule:
-            if (game.involves_team(team_id) and
-                game.date and
-                game.date > now and
-                not game.is_final):
-                upcoming_games.append(game)
 
-        if upcoming_games:
-            # Sort by date and return the earliest
-            upcoming_games.sort(key=lambda g: g.date or datetime.max.replace(tzinfo=timezone.utc))
-            return upcoming_games[0]
-
-        return None
+        # Earliest game that hasn't been played yet
+        return min(
+            (
+                game for game in team_schedule
+                if game.involves_team(team_id) and game.date and game.date > now and not game.is_final
+            ),
+            key=lambda g: g.date,
+            default=None,
+        )
 
     def _get_last_game_for_team(self, team_id: str, team_schedule: List[NFLGame]) -> Optional[NFLGame]:
         """Find the most recent completed game for a specific team."""
         now = datetime.now(timezone.utc)  # Make timezone-aware
-        completed_games = []
-
-        for game in team_schedule:
-            if (game.involves_team(team_id) and
-                game.date and
-                game.date < now and
-                game.is_final):
-                completed_games.append(game)
-
-        if completed_games:
-            # Sort by date and return the most recent
-            completed_games.sort(key=lambda g: g.date or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
-            return completed_games[0]
 
-        return None
+        # Most recent completed game
+        return max(
+            (
+                game for game in team_schedule
+                if game.involves_team(team_id) and game.date and game.date < now and game.is_final
+            ),
+            key=lambda g: g.date,
+            default=None,
+        )
 
-    def _format_next_game_display(self, game: Optional[NFLGame], team_id: str) -> str:
+    def _format_next_game_display(self, game: Optional[NFLGame], team_id: str) -> NextGameDisplay:
         """Format next game information for display."""
         if not game:
-            return "---"
+            return NextGameDisplay("", "---")
 
         opponent = game.get_opposing_team(team_id)
         if not opponent:
-            return "TBD"
+            return NextGameDisplay("", "TBD")
 
         game_time = self._format_game_datetime(game)
 
-        # Determine if home or away
+        # Determine if home or away (display text is upper case, so only the abbreviation needs converting)
         if game.home_team.team_id == team_id:
-            opponent_text = f"vs {opponent.abbreviation}"
+            opponent_text = f"VS {opponent.abbreviation.upper()}"
         else:
-            opponent_text = f"@ {opponent.abbreviation}"
+            opponent_text = f"@ {opponent.abbreviation.upper()}"
 
-        return {
-            "game_time": game_time,
-            "opponent_text": opponent_text
-        }
-        # SUN 10/4 1:00 PM VS BUF
-        #return f"{game_time} {opponent_text}".upper()
+        # return components for layout
+        return NextGameDisplay(game_time, opponent_text)
 
-    def _format_last_game_display(self, game: Optional[NFLGame], team_id: str) -> str:
+    def _format_last_game_display(self, game: Optional[NFLGame], team_id: str) -> LastGameResult:
         """Format last game result for display."""
         if not game:
-            return "---"
+            return LastGameResult("", "", "---")
 
         opponent = game.get_opposing_team(team_id)
         if not opponent:
-            return "TBD"
+            return LastGameResult("", "", "TBD")
 
         # Determine result and format
         if game.home_team.team_id == team_id:
             team_score = game.home_score
             opponent_score = game.away_score
-            opponent_text = f"VS {opponent.abbreviation}"
+            opponent_text = f"VS {opponent.abbreviation.upper()}"
         else:
             team_score = game.away_score
             opponent_score = game.home_score
-            opponent_text = f"AT {opponent.abbreviation}"
+            opponent_text = f"AT {opponent.abbreviation.upper()}"
 
         # Format result
         if team_score > opponent_score:
@@ -1061,25 +1356,21 @@ class NFLBoard(BoardBase):
         else:
             result = "T"
 
-        # return dictionary with components for layout
-        return {
-            "result": result,
-            "score": f"{team_score}-{opponent_score}",
-            "opponent": opponent_text
-        }
+        # return components for layout
+        return LastGameResult(result, f"{team_score}-{opponent_score}", opponent_text)
 
     def _render_fallback_team_summary(self, team: NFLTeam):
         """Render team summary when no layout is available."""
-        debug.debug(f"NFL Board: Rendering fallback team summary for {team.display_name}")
+        debug.debug("NFL Board: Rendering fallback team summary for %s", team.display_name)
 
         font = self.data.config.layout.font
-        debug.debug(f"NFL Board: Using font: {font}")
+        debug.debug("NFL Board: Using font: %s", font)
 
         # Simple text display
         debug.debug("NFL Board: Drawing team name")
         self.matrix.draw_text_centered(10, team.display_name, font)
 
-        debug.debug(f"NFL Board: Drawing record: {team.record_text}")
+        debug.debug("NFL Board: Drawing record: %s", team.record_text)
         self.matrix.draw_text_centered(25, f"Record: {team.record_text}", font)
 
         debug.debug("NFL Board: Drawing summary label")
@@ -1089,26 +1380,31 @@ class NFLBoard(BoardBase):
         # Render to the display
         self.matrix.render()
 
-        debug.debug(f"NFL Board: Waiting {self.config.display_seconds} seconds")
+        debug.debug("NFL Board: Waiting %s seconds", self.config.display_seconds)
         # Display the rendered content for configured duration
         self.sleepEvent.wait(self.config.display_seconds)
 
         debug.debug("NFL Board: Fallback team summary complete")
 
-    def _draw_text(self, layout, element_name: str, text: str) -> None:
-        """
-        Helper method to draw text on layout elements, similar to old implementation.
-        """
-        if hasattr(layout, element_name):
-            element = getattr(layout, element_name)
-            self.matrix.draw_text_layout(element, text)
+    @staticmethod
+    def _draw_text_batch(canvas, text_batch: List[Tuple[object, str, dict]]) -> None:
+        """Draw queued (layout element, text, style kwargs) entries on a canvas in order."""
+        draw_text_layout = canvas.draw_text_layout
+        for element, text, style in text_batch:
+            draw_text_layout(element, text, **style)
 
     def _load_gradient(self) -> Image.Image:
-        """Load appropriate gradient image for current matrix size."""
+        """
+        Load appropriate gradient image for current matrix size.
+        Decoded to RGBA once here so each draw reuses the same pixels.
+        """
         if self.matrix.height >= 48:
-            return Image.open(get_file('assets/images/128x64_scoreboard_center_gradient.png'))
+            gradient_file = get_file('assets/images/128x64_scoreboard_center_gradient.png')
         else:
-            return Image.open(get_file('assets/images/64x32_scoreboard_center_gradient.png'))
+            gradient_file = get_file('assets/images/64x32_scoreboard_center_gradient.png')
+
+        with Image.open(gradient_file) as gradient:
+            return gradient.convert("RGBA")
 
     def _get_board_directory(self) -> Path:
         """Get the directory path for this board plugin."""
@@ -1120,12 +1416,20 @@ class NFLBoard(BoardBase):
         # base_board should require this method if architecture ever changes load/unload boards
         debug.info("NFL Board: Cleaning up resources")
 
-        # Clear caches and display state
-        self.logo_cache.clear()
+        # Stop background logo loading, then clear caches and display state
+        self._logo_executor.shutdown(wait=False)
+        with self._logo_cache_lock:
+            self.logo_cache.clear()
+        self._zoomed_logo_cache.clear()
+        self._background_cache.clear()
+        self._datetime_text_cache.clear()
         self.current_display_items.clear()
 
         # Remove scheduled job if it exists
         scheduler = getattr(self.data, "scheduler", None)
-        if scheduler and scheduler.get_job(self._scheduled_job_id):
-            scheduler.remove_job(self._scheduled_job_id)
-            debug.info("NFL Board: Removed scheduled data refresh job")
+        if scheduler:
+            try:
+                scheduler.remove_job(self._scheduled_job_id)
+                debug.info("NFL Board: Removed scheduled data refresh job")
+            except JobLookupError:
+                pass
@@ -3,26 +3,103 @@ NFL Board Data Management - Clean Implementation
 Handles API calls and data processing using APScheduler for background refresh.
 """
 
+import hashlib
+import itertools
 import logging
+import os
+import threading
+import time
+import sys
 import requests
-from datetime import datetime, timedelta
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List, Optional, Dict, Any
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 debug = logging.getLogger("scoreboard")
 
+# Monotonic source of NFLDataSnapshot versions
+_snapshot_versions = itertools.count(1)
+
+# (connect, read) timeouts for ESPN API requests
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# Model dataclasses use __slots__ where supported (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Concurrent team detail requests made by populate_team_details
+_TEAM_DETAILS_WORKERS = 8
+
+# How long (seconds) on-disk API responses are served without refetching.
+# Team metadata barely changes in a season; anything carrying records or scores stays short.
+_TEAMS_CACHE_TTL = 86400
+_TEAM_DETAILS_CACHE_TTL = 300
+_SCHEDULE_CACHE_TTL = 300
+_SCOREBOARD_CACHE_TTL = 10
+
+# A stale response is only served after a failed request while younger than this many TTLs
+_STALE_CACHE_TTL_FACTOR = 24
+
+# Cached responses older than the longest stale window can never be served again; dated
+# scoreboard URLs add new files every day, so these are pruned when the client starts
+_RESPONSE_CACHE_MAX_AGE = _TEAMS_CACHE_TTL * _STALE_CACHE_TTL_FACTOR
+
+if sys.version_info >= (3, 11):
+    # Full ISO 8601 parser in C, accepts ESPN's trailing "Z" as UTC directly
+    _fromisoformat = datetime.fromisoformat
+else:
+    def _fromisoformat(value: str) -> datetime:
+        # Older fromisoformat rejects "Z", so parse the naive part and attach UTC
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
+        return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_espn_datetime_cached(value: str) -> datetime:
+    """Parse an ESPN datetime string; the same timestamps repeat across scoreboards and schedules."""
+    return _fromisoformat(value)
+
+
 def parse_espn_datetime(value: Optional[str]) -> Optional[datetime]:
     """Parse ESPN datetime strings which typically end with Z."""
     if not value:
         return None
     try:
-        # ESPN dates are UTC with "Z", convert to format that works with fromisoformat
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return _parse_espn_datetime_cached(value)
     except ValueError:
         debug.error(f"NFL Board: Could not parse datetime '{value}'")
         return None
 
 
+@lru_cache(maxsize=128)
+def _hex_to_rgb(hex_color: str) -> tuple:
+    """Convert hex color to RGB tuple (cached, teams share a small set of colors)."""
+    try:
+        # Strip leading '#' if present and decode all three channels at once
+        rgb = bytes.fromhex(hex_color.lstrip('#'))
+        return (rgb[0], rgb[1], rgb[2])
+    except (ValueError, TypeError, IndexError):
+        return (255, 255, 255)  # Default to white
+
+
 def safe_int_conversion(value: Optional[str]) -> Optional[int]:
     """Safely convert ESPN score strings to integers."""
     if value in (None, ""):
@@ -49,9 +126,24 @@ def safe_get_score_value(score_data) -> int:
     return 0
 
 
-@dataclass
+def _competitor_score(score_data) -> int:
+    """
+    Competitor score for game parsing. Scoreboard scores are plain strings, so try
+    int() directly and only fall back to safe_get_score_value for other shapes
+    (schedule scores are {"value": ...} dicts, missing scores are None).
+    """
+    try:
+        return int(score_data)
+    except (TypeError, ValueError):
+        return safe_get_score_value(score_data)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class NFLTeam:
-    """Represents an NFL team with all relevant information."""
+    """
+    Represents an NFL team with all relevant information.
+    Immutable: refreshed data replaces the cached instance rather than updating it.
+    """
     team_id: str
     name: str
     abbreviation: str
@@ -65,14 +157,17 @@ class NFLTeam:
     record_ties: int = 0
     record_summary: str = ""
     record_comment: Optional[str] = "---"
+    # Derived once in __post_init__ (teams are immutable) instead of on every render
+    has_detailed_record: bool = field(init=False, repr=False, compare=False)
+    record_text: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def has_detailed_record(self) -> bool:
-        """Check if this team has detailed record information loaded."""
-        return bool(self.record_summary or self.record_wins > 0 or self.record_losses > 0)
+    def __post_init__(self):
+        # Whether detailed record information is loaded
+        has_detailed_record = bool(self.record_summary or self.record_wins > 0 or self.record_losses > 0)
+        object.__setattr__(self, "has_detailed_record", has_detailed_record)
+        object.__setattr__(self, "record_text", self._format_record_text())
 
-    @property
-    def record_text(self) -> str:
+    def _format_record_text(self) -> str:
         """Format team record for display with safe fallback."""
         # Use detailed record if available
         if self.record_summary:
@@ -88,7 +183,7 @@ class NFLTeam:
         return "---"
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class NFLGame:
     """Represents an NFL game with complete information."""
     game_id: str
@@ -104,10 +199,15 @@ class NFLGame:
     is_final: bool = False
     is_live: bool = False
     venue: Optional[str] = None
+    team_ids: frozenset = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Precompute participating team IDs for set-based favorite filtering (frozen, so bypass __setattr__)
+        object.__setattr__(self, "team_ids", frozenset((self.home_team.team_id, self.away_team.team_id)))
 
     def involves_team(self, team_id: str) -> bool:
         """Check if this game involves the specified team."""
-        return self.home_team.team_id == team_id or self.away_team.team_id == team_id
+        return team_id in self.team_ids
 
     def get_opposing_team(self, team_id: str) -> Optional[NFLTeam]:
         """Get the opposing team for the specified team ID."""
@@ -133,40 +233,130 @@ class NFLApiClient:
     Provides clean methods for different data needs.
     """
 
-    def __init__(self):
+    def __init__(self, response_cache_directory: Optional[Path] = None):
+        """
+        Initialize the API client.
+
+        Args:
+            response_cache_directory: Directory for cached API responses (default: ~/.cache/nfl-board)
+        """
         self.base_url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
+        self.response_cache_directory = response_cache_directory or (
+            Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "nfl-board"
+        )
         self.teams_cache: Dict[str, NFLTeam] = {}
-        self.last_teams_fetch: Optional[datetime] = None
+        # In-memory freshness as time.monotonic() deadlines (unaffected by wall clock changes)
+        self.teams_ttl = 3600
+        self.teams_cache_expiry = 0.0
+        self.team_details_ttl = 3600
+        self.team_details_expiry: Dict[str, float] = {}
+        # Guards teams_cache/team_details_expiry updates from concurrent get_team_details calls
+        self._teams_lock = threading.Lock()
+        # Teams seen only as game competitors (e.g. Pro Bowl sides), kept out of teams_cache
+        # so they never show up in get_all_teams(); written from scoreboard/schedule workers
+        self._competitor_team_cache: Dict[str, NFLTeam] = {}
+        self._competitor_team_lock = threading.Lock()
+
+        # Every request goes to the same ESPN host, so keep connections alive and reuse them
+        self.session = requests.Session()
+        self.session.headers.update({"Accept-Encoding": "gzip", "User-Agent": "nfl-board"})
+        retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+
+        self._prune_response_cache()
+
+    def _prune_response_cache(self) -> None:
+        """Delete cached responses (and leftover temp files) too old to ever be served."""
+        cutoff = time.time() - _RESPONSE_CACHE_MAX_AGE
+        try:
+            with os.scandir(self.response_cache_directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            # Missing cache directory: nothing to prune
+            pass
+
+    def _cached_get(self, url: str, ttl_seconds: int) -> Dict[str, Any]:
+        """
+        GET a JSON endpoint through an on-disk response cache.
+        Serves the cached body while it is younger than ttl_seconds, and falls
+        back to a stale cached body if the request fails, as long as it is younger
+        than _STALE_CACHE_TTL_FACTOR * ttl_seconds.
+        """
+        cache_path = self.response_cache_directory / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+        cached = None
+        try:
+            cached = _json_loads(cache_path.read_bytes())
+            if time.time() - cached["ts"] < ttl_seconds:
+                return cached["body"]
+        except (OSError, ValueError, KeyError, TypeError):
+            cached = None
+
+        try:
+            response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
+            response.raise_for_status()
+            data = _json_loads(response.content)
+        except Exception as exc:
+            if cached is None or time.time() - cached["ts"] >= ttl_seconds * _STALE_CACHE_TTL_FACTOR:
+                raise
+            debug.warning(f"NFL Board: Request for {url} failed ({exc}), using cached response")
+            return cached["body"]
+
+        self._write_cached_response(cache_path, data)
+        return data
+
+    def _write_cached_response(self, cache_path: Path, data: Dict[str, Any]) -> None:
+        """
+        Store a response body with its fetch time.
+        Written to a temp file and renamed so readers never see a partial file.
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+            temp_path.write_bytes(_json_dumps({"ts": time.time(), "body": data}))
+            os.replace(temp_path, cache_path)
+        except OSError as exc:
+            debug.warning(f"NFL Board: Could not cache response at {cache_path}: {exc}")
 
     def get_scoreboard_for_date(self, date: datetime) -> List[NFLGame]:
         """
         Get all games for a specific date using ESPN scoreboard endpoint.
         Date format: YYYYMMDD
         """
+        games = list(self.iter_scoreboard_for_date(date))
+        debug.debug(f"NFL Board: Found {len(games)} games for {date:%Y%m%d}")
+        return games
+
+    def iter_scoreboard_for_date(self, date: datetime) -> Iterator[NFLGame]:
+        """
+        Fetch the scoreboard for a date and parse its games lazily.
+        Callers that only need a few games (e.g. one team's) can stop early
+        without building every NFLGame.
+        """
         date_string = date.strftime("%Y%m%d")
         url = f"{self.base_url}/scoreboard?dates={date_string}"
 
         debug.debug(f"NFL Board: Fetching scoreboard for {date_string}")
 
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            games = []
-            events = data.get("events", [])
-
-            for event in events:
-                game = self._parse_game_from_event(event)
-                if game:
-                    games.append(game)
-
-            debug.debug(f"NFL Board: Found {len(games)} games for {date_string}")
-            return games
-
+            data = self._cached_get(url, _SCOREBOARD_CACHE_TTL)
         except Exception as exc:
             debug.error(f"NFL Board: Failed to fetch scoreboard for {date_string}: {exc}")
-            return []
+            return iter(())
+
+        return self._iter_games(data.get("events", []))
+
+    def _iter_games(self, events: List[Dict[str, Any]]) -> Iterator[NFLGame]:
+        """Yield the games that parse successfully from ESPN events."""
+        for event in events:
+            game = self._parse_game_from_event(event)
+            if game:
+                yield game
 
     def get_current_scoreboard(self) -> List[NFLGame]:
         """Get current/today's games."""
@@ -178,17 +368,14 @@ class NFLApiClient:
         Use get_team_details() to populate full details for specific teams.
         """
         # Use cached data if less than 1 hour old
-        if (self.teams_cache and self.last_teams_fetch and
-            datetime.now() - self.last_teams_fetch < timedelta(hours=1)):
+        if self.teams_cache and time.monotonic() < self.teams_cache_expiry:
             return self.teams_cache
 
         try:
             url = f"{self.base_url}/teams"
             debug.info(f"NFL Board: Fetching basic teams data")
 
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._cached_get(url, _TEAMS_CACHE_TTL)
 
             teams = {}
             sports = data.get("sports", [])
@@ -201,10 +388,14 @@ class NFLApiClient:
                         team_data = team_item.get("team", {})
                         team = self._parse_basic_team_data(team_data)
                         if team:
+                            # Keep the previous (possibly detailed) instance if nothing basic changed
+                            previous = self.teams_cache.get(team.team_id)
+                            if previous and self._same_basic_team(previous, team):
+                                team = previous
                             teams[team.team_id] = team
 
             self.teams_cache = teams
-            self.last_teams_fetch = datetime.now()
+            self.teams_cache_expiry = time.monotonic() + self.teams_ttl
 
             debug.info(f"NFL Board: Cached {len(teams)} basic teams")
             return teams
@@ -222,17 +413,9 @@ class NFLApiClient:
             url = f"{self.base_url}/teams/{team_id}/schedule"
             debug.debug(f"NFL Board: Fetching schedule for team {team_id}")
 
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            games = []
-            events = data.get("events", [])
+            data = self._cached_get(url, _SCHEDULE_CACHE_TTL)
 
-            for event in events:
-                game = self._parse_game_from_event(event)
-                if game:
-                    games.append(game)
+            games = list(self._iter_games(data.get("events", [])))
 
             debug.debug(f"NFL Board: Found {len(games)} scheduled games for team {team_id}")
             return games
@@ -241,6 +424,24 @@ class NFLApiClient:
             debug.error(f"NFL Board: Failed to fetch schedule for team {team_id}: {exc}")
             return []
 
+    @staticmethod
+    def _same_basic_team(first: NFLTeam, second: NFLTeam) -> bool:
+        """Check whether two teams match on the fields provided by the /teams endpoint."""
+        return (
+            first.team_id == second.team_id
+            and first.name == second.name
+            and first.abbreviation == second.abbreviation
+            and first.display_name == second.display_name
+            and first.location == second.location
+            and first.color_primary == second.color_primary
+            and first.color_secondary == second.color_secondary
+            and first.logo_url == second.logo_url
+        )
+
+    def team_details_expired(self, team_id: str) -> bool:
+        """Check if a team's detailed record data is missing or older than the TTL."""
+        return time.monotonic() >= self.team_details_expiry.get(team_id, 0.0)
+
     def _parse_basic_team_data(self, team_data: Dict[str, Any]) -> Optional[NFLTeam]:
         """Parse basic team information from ESPN /teams endpoint (no detailed records)."""
         try:
@@ -255,8 +456,8 @@ class NFLApiClient:
                 logo_url = logos[0].get("href")
 
             # Convert colors to RGB tuples
-            color_primary = self._hex_to_rgb(team_data.get("color", "000000"))
-            color_secondary = self._hex_to_rgb(team_data.get("alternateColor", "FFFFFF"))
+            color_primary = _hex_to_rgb(team_data.get("color", "000000"))
+            color_secondary = _hex_to_rgb(team_data.get("alternateColor", "FFFFFF"))
 
             return NFLTeam(
                 team_id=team_id,
@@ -267,12 +468,7 @@ class NFLApiClient:
                 color_primary=color_primary,
                 color_secondary=color_secondary,
                 logo_url=logo_url,
-                # Note: No detailed record data - use get_team_details() to populate
-                record_wins=0,
-                record_losses=0,
-                record_ties=0,
-                record_summary="",
-                record_comment="---"
+                # Note: No detailed record data (field defaults) - use get_team_details() to populate
             )
 
         except Exception as exc:
@@ -321,8 +517,8 @@ class NFLApiClient:
             record_comment = team_data.get("standingSummary")
 
             # Convert colors to RGB tuples (old implementation expected tuples)
-            color_primary = self._hex_to_rgb(team_data.get("color", "000000"))
-            color_secondary = self._hex_to_rgb(team_data.get("alternateColor", "FFFFFF"))
+            color_primary = _hex_to_rgb(team_data.get("color", "000000"))
+            color_secondary = _hex_to_rgb(team_data.get("alternateColor", "FFFFFF"))
 
             return NFLTeam(
                 team_id=team_id,
@@ -363,17 +559,14 @@ class NFLApiClient:
             if len(competitors) < 2:
                 return None
 
-            # Find home and away teams
-            home_competitor = None
-            away_competitor = None
-
-            for competitor in competitors:
-                if competitor.get("homeAway") == "home":
-                    home_competitor = competitor
-                elif competitor.get("homeAway") == "away":
-                    away_competitor = competitor
-
-            if not home_competitor or not away_competitor:
+            # Find home and away teams (ESPN lists exactly two competitors, usually home first)
+            first_competitor, second_competitor = competitors[0], competitors[1]
+            sides = (first_competitor.get("homeAway"), second_competitor.get("homeAway"))
+            if sides == ("home", "away"):
+                home_competitor, away_competitor = first_competitor, second_competitor
+            elif sides == ("away", "home"):
+                home_competitor, away_competitor = second_competitor, first_competitor
+            else:
                 return None
 
             # Parse team data from competitors
@@ -384,19 +577,16 @@ class NFLApiClient:
                 return None
 
             # Parse scores safely (handles both string and dict formats)
-            home_score_data = home_competitor.get("score")
-            away_score_data = away_competitor.get("score")
-
-            home_score = safe_get_score_value(home_score_data)
-            away_score = safe_get_score_value(away_score_data)
+            home_score = _competitor_score(home_competitor.get("score"))
+            away_score = _competitor_score(away_competitor.get("score"))
 
             # Parse game status
-            status = competition.get("status", {})
-            status_type = status.get("type", {})
-            status_state = status_type.get("state", "pre")
-            status_detail = status_type.get("shortDetail", "Scheduled")
+            status = competition.get("status") or {}
+            status_type_get = (status.get("type") or {}).get
+            status_state = status_type_get("state", "pre")
+            status_detail = status_type_get("shortDetail", "Scheduled")
 
-            is_final = status_type.get("completed", False)
+            is_final = status_type_get("completed", False)
             is_live = status_state == "in"
 
             # Parse live game details
@@ -429,9 +619,7 @@ class NFLApiClient:
             )
 
         except Exception as exc:
-            debug.error(f"NFL Board: Failed to parse game data: {exc}")
-            import traceback
-            debug.error(traceback.print_exc())
+            debug.exception("NFL Board: Failed to parse game data: %s", exc)
             return None
 
     def _parse_competitor_team(self, competitor: Dict[str, Any]) -> Optional[NFLTeam]:
@@ -443,8 +631,9 @@ class NFLApiClient:
             return None
 
         # Check if we have this team in cache
-        if team_id in self.teams_cache:
-            return self.teams_cache[team_id]
+        team = self.teams_cache.get(team_id) or self._competitor_team_cache.get(team_id)
+        if team:
+            return team
 
         # Create basic team info from competitor data
         logo_url = None
@@ -452,7 +641,7 @@ class NFLApiClient:
         if logos:
             logo_url = logos[0].get("href")
 
-        return NFLTeam(
+        team = NFLTeam(
             team_id=team_id,
             name=team_data.get("name", ""),
             abbreviation=team_data.get("abbreviation", ""),
@@ -463,6 +652,10 @@ class NFLApiClient:
             logo_url=logo_url
         )
 
+        # Cache it so later games with this team reuse the same instance
+        with self._competitor_team_lock:
+            return self._competitor_team_cache.setdefault(team_id, team)
+
     def get_team_details(self, team_id: str) -> bool:
         """
         Fetch detailed team information and update the cached team.
@@ -472,14 +665,14 @@ class NFLApiClient:
             url = f"{self.base_url}/teams/{team_id}"
             debug.debug(f"NFL Board: Fetching detailed data for team {team_id}")
 
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._cached_get(url, _TEAM_DETAILS_CACHE_TTL)
 
             detailed_team = self._parse_team_data(data.get("team", {}))
             if detailed_team and team_id in self.teams_cache:
                 # Update the cached team with detailed information
-                self.teams_cache[team_id] = detailed_team
+                with self._teams_lock:
+                    self.teams_cache[team_id] = detailed_team
+                    self.team_details_expiry[team_id] = time.monotonic() + self.team_details_ttl
                 debug.debug(f"NFL Board: Updated team {team_id} with detailed record data")
                 return True
             else:
@@ -495,26 +688,17 @@ class NFLApiClient:
         Populate detailed information for specified teams.
         Returns count of successfully updated teams.
         """
-        success_count = 0
         debug.info(f"NFL Board: Populating details for {len(team_ids)} teams")
+        if not team_ids:
+            return 0
 
-        for team_id in team_ids:
-            if self.get_team_details(team_id):
-                success_count += 1
+        # Requests are independent, so fetch them concurrently over the pooled session
+        with ThreadPoolExecutor(max_workers=min(_TEAM_DETAILS_WORKERS, len(team_ids))) as executor:
+            success_count = sum(executor.map(self.get_team_details, team_ids))
 
         debug.info(f"NFL Board: Successfully populated details for {success_count}/{len(team_ids)} teams")
         return success_count
 
-    def _hex_to_rgb(self, hex_color: str) -> tuple:
-        """Convert hex color to RGB tuple."""
-        try:
-            # Strip leading '#' if present
-            hex_color = hex_color.lstrip('#')
-            # Convert to RGB tuple
-            return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        except (ValueError, TypeError):
-            return (255, 255, 255)  # Default to white
-
 
 class NFLDataSnapshot:
     """
@@ -523,6 +707,7 @@ class NFLDataSnapshot:
     """
 
     def __init__(self):
+        self.version = next(_snapshot_versions)
         self.timestamp = datetime.now()
         self.error_message: Optional[str] = None
 
@@ -537,4 +722,20 @@ class NFLDataSnapshot:
         self.live_games: List[NFLGame] = []
 
         # Team schedules for favorite teams
-        self.team_schedules: Dict[str, List[NFLGame]] = {}
\ No newline at end of file
+        self.team_schedules: Dict[str, List[NFLGame]] = {}
+
+    def clone(self) -> "NFLDataSnapshot":
+        """
+        Create a new snapshot sharing this one's data (shallow copy).
+        Containers are copied so the clone can be updated without touching a published snapshot.
+        """
+        snapshot = NFLDataSnapshot()
+        snapshot.error_message = self.error_message
+        snapshot.all_teams = dict(self.all_teams)
+        snapshot.favorite_teams = dict(self.favorite_teams)
+        snapshot.todays_games = list(self.todays_games)
+        snapshot.yesterdays_games = list(self.yesterdays_games)
+        snapshot.favorite_team_games = list(self.favorite_team_games)
+        snapshot.live_games = list(self.live_games)
+        snapshot.team_schedules = dict(self.team_schedules)
+        return snapshot
\ No newline at end of file
@@ -5,24 +5,50 @@ Handles logo downloading, caching, and file ownership management.
 
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import platform
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 from PIL import Image
 import io
+import json
 
 from .data import NFLTeam
 
 debug = logging.getLogger("scoreboard")
 
-# Get UID/GID for file ownership fixes (when running as root)
-try:
-    uid = int(os.stat("./VERSION").st_uid)
-    gid = int(os.stat("./VERSION").st_uid)
-except:
-    uid = None
-    gid = None
+# Concurrent logo downloads during preload_logos_for_teams
+_PRELOAD_WORKERS = 16
+
+# Seconds to wait before retrying a logo whose download failed
+_FAILED_DOWNLOAD_RETRY_SECONDS = 3600
+
+# Ownership fixes only matter (and only work) when running as root
+_IS_ROOT = hasattr(os, "geteuid") and os.geteuid() == 0
+
+# UID/GID for file ownership fixes (when running as root), read lazily from the app's VERSION file
+_ownership = None
+
+
+def _get_ownership():
+    """Return the (uid, gid) that owns the scoreboard install, or (None, None) if unknown or not root."""
+    global _ownership
+    if _ownership is None:
+        if not _IS_ROOT:
+            # Files are already created as the running user; skip every chown walk
+            _ownership = (None, None)
+            return _ownership
+        try:
+            stat_info = os.stat("./VERSION")
+            _ownership = (stat_info.st_uid, stat_info.st_gid)
+        except OSError:
+            _ownership = (None, None)
+    return _ownership
 
 
 class NFLLogoManager:
@@ -40,6 +66,22 @@ class NFLLogoManager:
         """
         self.logo_cache_directory = logo_cache_directory or Path("assets/logos/nfl")
 
+        # High quality downscaling filter, resolved once for old and new Pillow versions
+        resampling = getattr(getattr(Image, "Resampling", Image), "LANCZOS", None)
+        if resampling is None:
+            resampling = getattr(Image, "LANCZOS", getattr(Image, "ANTIALIAS", Image.BICUBIC))
+        self._resampling = resampling
+        # Cheaper filter for mild downscales, where LANCZOS gives no visible benefit
+        self._mild_resampling = getattr(getattr(Image, "Resampling", Image), "BILINEAR")
+
+        # Logos come from a single CDN host, so keep connections alive across downloads
+        self._session = requests.Session()
+        retries = Retry(total=2, backoff_factor=0.2)
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=_PRELOAD_WORKERS, max_retries=retries))
+
+        # Downloaded source logo bytes by team abbreviation, shared by every rendered size
+        self._source_cache: Dict[str, bytes] = {}
+
         # Ensure logo cache directory exists
         self.logo_cache_directory.mkdir(parents=True, exist_ok=True)
 
@@ -55,6 +97,7 @@ class NFLLogoManager:
         if platform.system() != 'Linux':
             return
 
+        uid, gid = _get_ownership()
         if not (hasattr(os, "chown") and uid is not None and gid is not None):
             return
 
@@ -71,7 +114,7 @@ class NFLLogoManager:
                 stat_info = os.stat(str(current))
                 if stat_info.st_uid == uid:
                     break
-            except:
+            except OSError:
                 pass
 
         # Fix ownership starting from the topmost directory down
@@ -89,26 +132,60 @@ class NFLLogoManager:
         """
         # If we're not on a Unix distro, this won't do anything
         if platform.system() == 'Linux':
+            uid, gid = _get_ownership()
             if hasattr(os, "chown") and uid is not None and gid is not None:
-                for root, dirs, files in os.walk(str(path)):
-                    for d in dirs:
-                        try:
-                            os.chown(os.path.join(root, d), uid, gid)
-                        except Exception as exc:
-                            debug.warning(f"NFL Logo Manager: Failed to chown directory {d}: {exc}")
-                    for f in files:
-                        try:
-                            os.chown(os.path.join(root, f), uid, gid)
-                        except Exception as exc:
-                            debug.warning(f"NFL Logo Manager: Failed to chown file {f}: {exc}")
-
-    def download_team_logo(self, team: NFLTeam, size: int = 64) -> Optional[Path]:
+                self._chown_tree(str(path), uid, gid)
+
+    def _chown_tree(self, path: str, uid: int, gid: int, parent_fd: Optional[int] = None) -> None:
+        """
+        Chown everything below a directory, working relative to an open directory fd
+        so each entry is resolved by name instead of by its full path.
+        """
+        try:
+            dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY, dir_fd=parent_fd)
+        except OSError as exc:
+            debug.warning(f"NFL Logo Manager: Failed to open directory {path}: {exc}")
+            return
+
+        try:
+            with os.scandir(dir_fd) as entries:
+                for entry in entries:
+                    try:
+                        stat_info = entry.stat(follow_symlinks=False)
+                        if (stat_info.st_uid, stat_info.st_gid) != (uid, gid):
+                            os.chown(entry.name, uid, gid, dir_fd=dir_fd, follow_symlinks=False)
+                    except OSError as exc:
+                        debug.warning(f"NFL Logo Manager: Failed to chown {entry.name}: {exc}")
+                    if entry.is_dir(follow_symlinks=False):
+                        self._chown_tree(entry.name, uid, gid, parent_fd=dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _fix_file_ownership(self, path: Path) -> None:
+        """Fix ownership of a single newly written file when running as root on Linux."""
+        uid, gid = _get_ownership()
+        if platform.system() == 'Linux' and hasattr(os, "chown") and uid is not None and gid is not None:
+            self._chown_path(str(path))
+
+    def _chown_path(self, path) -> None:
+        """Give a single file or directory the scoreboard's ownership, skipping it if uid and gid already match."""
+        uid, gid = _get_ownership()
+        try:
+            stat_info = os.stat(path)
+            if (stat_info.st_uid, stat_info.st_gid) == (uid, gid):
+                return
+            os.chown(path, uid, gid)
+        except Exception as exc:
+            debug.warning(f"NFL Logo Manager: Failed to chown {path}: {exc}")
+
+    def download_team_logo(self, team: NFLTeam, size: int = 64, defer_chown: bool = False) -> Optional[Path]:
         """
         Download and cache a team logo as a PNG file.
 
         Args:
             team: NFLTeam object with logo_url
             size: Target size for the logo (default 64px)
+            defer_chown: Skip fixing file ownership; the caller fixes the whole cache afterwards
 
         Returns:
             Path to cached logo file, or None if download failed
@@ -125,52 +202,160 @@ class NFLLogoManager:
         if cache_path.exists():
             return cache_path
 
+        # Don't hammer a broken logo URL: a recent failure is remembered by a marker file
+        failure_marker = cache_path.with_suffix(".fail")
         try:
-            debug.debug(f"NFL Logo Manager: Downloading logo for {team.abbreviation} from {team.logo_url}")
+            if time.time() - failure_marker.stat().st_mtime < _FAILED_DOWNLOAD_RETRY_SECONDS:
+                debug.debug(f"NFL Logo Manager: Skipping logo for {team.abbreviation}, download failed recently")
+                return None
+        except OSError:
+            pass
 
-            # Download the logo
-            response = requests.get(team.logo_url, timeout=10)
-            response.raise_for_status()
+        try:
+            source_bytes = self._source_cache.get(team.abbreviation) or self._download_source(team, defer_chown)
+            if not source_bytes:
+                return None
 
-            # Open and resize the image
-            image = Image.open(io.BytesIO(response.content))
+            self._render_logo(source_bytes, size, cache_path)
 
-            # Convert to RGBA if not already (for transparency support)
-            if image.mode != 'RGBA':
-                image = image.convert('RGBA')
+            # Fix ownership of the new file if running as root
+            if not defer_chown:
+                self._fix_file_ownership(cache_path)
 
-            # Trim Transparency
-            bbox = image.getbbox()
-            image = image.crop(bbox)
-            # Keep aspect ratio but ensure the longest edge is equal to size.
-            resampling = getattr(getattr(Image, "Resampling", Image), "LANCZOS", None)
-            if resampling is None:
-                resampling = getattr(Image, "LANCZOS", getattr(Image, "ANTIALIAS", Image.BICUBIC))
-            image.thumbnail((size, size), resampling)
+            debug.debug(f"NFL Logo Manager: Cached logo for {team.abbreviation} at {cache_path}")
+            failure_marker.unlink(missing_ok=True)
+            return cache_path
 
-            # Create a square canvas and center the logo
-            square_image = Image.new('RGBA', (size, size), (255, 255, 255, 0))
+        except Exception as exc:
+            debug.error(f"NFL Logo Manager: Failed to download logo for {team.abbreviation}: {exc}")
+            try:
+                failure_marker.touch()
+                if not defer_chown:
+                    self._fix_file_ownership(failure_marker)
+            except OSError:
+                pass
+            return None
 
-            # Calculate position to center the logo
-            x = (size - image.width) // 2
-            y = (size - image.height) // 2
+    def _download_source(self, team: NFLTeam, defer_chown: bool = False) -> Optional[bytes]:
+        """
+        Fetch a team's original logo image, once per team for all sizes.
 
-            square_image.paste(image, (x, y), image)
+        The source is kept next to the sized logos along with its ETag/Last-Modified
+        validators, so a later fetch is a conditional request that ESPN can answer
+        with 304 Not Modified instead of resending the image.
+        """
+        source_path = self.logo_cache_directory / f"{team.abbreviation.lower()}.src"
+        validators_path = self.logo_cache_directory / f"{team.abbreviation.lower()}.src.json"
 
-            # Save as PNG
-            square_image.save(cache_path, 'PNG')
+        headers = {}
+        if source_path.exists():
+            try:
+                validators = json.loads(validators_path.read_text())
+                if validators.get("etag"):
+                    headers["If-None-Match"] = validators["etag"]
+                if validators.get("last_modified"):
+                    headers["If-Modified-Since"] = validators["last_modified"]
+            except (OSError, ValueError):
+                pass
 
-            # Fix file ownership if running as root
-            self.change_ownership(cache_path.parent)
+        debug.debug(f"NFL Logo Manager: Downloading logo for {team.abbreviation} from {team.logo_url}")
+        response = self._session.get(team.logo_url, headers=headers, timeout=10)
 
-            debug.debug(f"NFL Logo Manager: Cached logo for {team.abbreviation} at {cache_path}")
-            return cache_path
+        if response.status_code == 304:
+            debug.debug(f"NFL Logo Manager: Source logo for {team.abbreviation} not modified")
+            source_bytes = source_path.read_bytes()
+        else:
+            response.raise_for_status()
+            source_bytes = response.content
+
+            self._write_atomic(source_path, source_bytes)
+            self._write_atomic(validators_path, json.dumps({
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }).encode("utf-8"))
+            if not defer_chown:
+                self._fix_file_ownership(source_path)
+                self._fix_file_ownership(validators_path)
+
+        self._source_cache[team.abbreviation] = source_bytes
+        return source_bytes
+
+    def _render_logo(self, source_bytes: bytes, size: int, cache_path: Path) -> None:
+        """Trim, scale and center a source logo on a square transparent canvas saved as PNG."""
+        # Open and resize the image
+        image = Image.open(io.BytesIO(source_bytes))
+
+        # A PNG that is already a square RGBA logo of the target size, with no transparent
+        # border to trim, would come out of the pipeline unchanged: store the bytes as is
+        if (
+            image.format == 'PNG'
+            and image.mode == 'RGBA'
+            and image.size == (size, size)
+            and image.getbbox() == (0, 0, size, size)
+        ):
+            self._write_atomic(cache_path, source_bytes)
+            return
 
-        except Exception as exc:
-            debug.error(f"NFL Logo Manager: Failed to download logo for {team.abbreviation}: {exc}")
-            return None
+        # JPEG sources can be decoded at a reduced scale (1/2 .. 1/8) by libjpeg itself;
+        # keep at least 2x the target so the final resize still has detail to work with
+        if image.format == 'JPEG':
+            image.draft('RGB', (size * 2, size * 2))
+
+        # Convert to RGBA if not already (for transparency support)
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+
+        # Trim transparency and scale down in one pass: resize straight from the
+        # non-transparent bounding box, keeping the aspect ratio with the longest edge at size
+        bbox = image.getbbox() or (0, 0, image.width, image.height)
+        width, height = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        scale = min(size / width, size / height)
+        if scale < 1:
+            target_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            # Less than 2x reduction: bilinear is enough; larger reductions need LANCZOS to avoid aliasing
+            resampling = self._mild_resampling if scale > 0.5 else self._resampling
+            image = image.resize(target_size, resampling, box=bbox)
+        else:
+            # Already fits, only trim (logos are never scaled up)
+            image = image.crop(bbox)
+
+        # Create a fully transparent square canvas and center the logo
+        square_image = Image.new('RGBA', (size, size))
+
+        # Calculate position to center the logo
+        x = (size - image.width) // 2
+        y = (size - image.height) // 2
+
+        square_image.paste(image, (x, y), image)
+
+        # Save as PNG next to the final path and rename it into place, so an interrupted
+        # write never leaves a truncated logo that later looks cached. Light compression:
+        # the cache is local and read far more than written, so zlib CPU costs more than bytes.
+        self._replace_atomic(cache_path, lambda temp_path: square_image.save(temp_path, 'PNG', compress_level=1))
 
-    def get_team_logo_path(self, team: NFLTeam, size: int = 128, download_if_missing: bool = True) -> Optional[Path]:
+    @classmethod
+    def _write_atomic(cls, path: Path, data: bytes) -> None:
+        """Write a file via a temporary file and rename, so readers never see partial contents."""
+        cls._replace_atomic(path, lambda temp_path: temp_path.write_bytes(data))
+
+    @staticmethod
+    def _replace_atomic(path: Path, write) -> None:
+        """
+        Call write with a temporary path next to path, then rename it into place.
+        The temp name is unique per thread: preload workers, the refresh prewarm and
+        the render thread can write the same logo at the same time.
+        """
+        temp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            write(temp_path)
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def get_team_logo_path(
+        self, team: NFLTeam, size: int = 128, download_if_missing: bool = True, defer_chown: bool = False
+    ) -> Optional[Path]:
         """
         Get the local path to a team's logo, optionally downloading if missing.
 
@@ -178,6 +363,7 @@ class NFLLogoManager:
             team: NFLTeam object
             size: Target logo size (default 128px)
             download_if_missing: Whether to download the logo if not cached
+            defer_chown: Skip fixing ownership of downloaded files (see download_team_logo)
 
         Returns:
             Path to logo file, or None if not available
@@ -191,7 +377,7 @@ class NFLLogoManager:
 
         # Download if requested and URL available
         if download_if_missing and team.logo_url:
-            return self.download_team_logo(team, size)
+            return self.download_team_logo(team, size, defer_chown=defer_chown)
 
         return None
 
@@ -206,12 +392,19 @@ class NFLLogoManager:
         Returns:
             Number of logos successfully downloaded/cached
         """
-        success_count = 0
+        if not teams:
+            return 0
+
+        def preload(team: NFLTeam) -> Optional[Path]:
+            return self.get_team_logo_path(team, size, download_if_missing=True, defer_chown=True)
+
+        # Downloads are independent network requests, so run them concurrently.
+        # Ownership is fixed in one pass below rather than per downloaded file.
+        with ThreadPoolExecutor(max_workers=min(_PRELOAD_WORKERS, len(teams))) as executor:
+            success_count = sum(1 for logo_path in executor.map(preload, teams) if logo_path)
 
-        for team in teams:
-            logo_path = self.get_team_logo_path(team, size, download_if_missing=True)
-            if logo_path:
-                success_count += 1
+        # One ownership pass over the cache once the whole batch is written
+        self.change_ownership(self.logo_cache_directory)
 
         debug.debug(f"NFL Logo Manager: Preloaded {success_count}/{len(teams)} team logos")
         return success_count
@@ -1,61 +1,160 @@
 #!/usr/bin/env python3
 import requests
 import json
+import os
+import time
 from difflib import SequenceMatcher
+from pathlib import Path
 import sys
 
+# rapidfuzz (C++ scorer) is used when installed; difflib is the fallback
+try:
+    from rapidfuzz import fuzz, process, utils
+except ImportError:
+    process = None
+
+# The team list only changes between seasons, so reuse a local copy for a week
+TEAMS_CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "nfl_team_finder" / "teams.json"
+TEAMS_CACHE_TTL = 7 * 86400
+
+# Search index for the most recently searched teams_data: (teams_data, index).
+# The teams_data reference is kept so the identity check can't match a recycled object.
+_index_cache = (None, None)
+
 def get_nfl_teams():
-    """Fetch NFL teams data from ESPN API"""
+    """Fetch NFL teams data from ESPN API (cached on disk)"""
+    try:
+        if time.time() - TEAMS_CACHE_PATH.stat().st_mtime < TEAMS_CACHE_TTL:
+            with open(TEAMS_CACHE_PATH, "rb") as cache_file:
+                return json.load(cache_file)
+    except (OSError, ValueError):
+        pass
+
     url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/teams"
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        with requests.Session() as session:
+            response = session.get(url, timeout=(3.05, 10))
+            response.raise_for_status()
+            teams_data = response.json()
     except requests.RequestException as e:
         print(f"Error fetching data: {e}")
         return None
 
+    # Write to a temp file and rename, so an interrupted run can't leave a partial cache
+    try:
+        TEAMS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = TEAMS_CACHE_PATH.with_suffix(".json.tmp")
+        temp_path.write_text(json.dumps(teams_data))
+        os.replace(temp_path, TEAMS_CACHE_PATH)
+    except OSError:
+        pass
+
+    return teams_data
+
 def similarity(a, b):
-    """Calculate similarity between two strings"""
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    """Calculate similarity between two already lowercased strings"""
+    return SequenceMatcher(None, a, b).ratio()
 
 def find_team_id(search_term, teams_data):
     """Find team ID using fuzzy search"""
     if not teams_data or 'sports' not in teams_data:
         return None
 
-    teams = teams_data['sports'][0]['leagues'][0]['teams']
-    best_match = None
+    index = _prepare_index(teams_data)
+
+    # Normalize the search term once so every matching path scores the same input
+    search_term = search_term.strip()
+    search_lower = search_term.lower()
+
+    # An exact (case-insensitive) name/abbreviation match is always the best answer
+    team_info = index['exact'].get(search_lower)
+    if team_info:
+        return _team_result(team_info, 1.0)
+
+    if process is not None:
+        return _find_team_id_rapidfuzz(search_term, index)
+
     best_score = 0
+    best_position = None
+
+    # Find best match among all teams' search fields; the result is built once at the end
+    for position, field_lower in enumerate(index['fields_lower']):
+        score = similarity(search_lower, field_lower)
+        if score > best_score:
+            best_score = score
+            best_position = position
 
-    for team in teams:
+    if best_position is None or best_score <= 0.3:
+        return None
+    return _team_result(index['teams'][best_position], best_score)
+
+def _prepare_index(teams_data):
+    """
+    Flatten every team's search fields once per teams_data, so repeated searches
+    don't rebuild field lists or lowercase them again.
+    """
+    global _index_cache
+    cached_data, cached_index = _index_cache
+    if cached_data is teams_data:
+        return cached_index
+
+    fields = []
+    fields_lower = []
+    teams = []
+    exact = {}
+    for team in teams_data['sports'][0]['leagues'][0]['teams']:
         team_info = team['team']
 
-        # Search fields to match against
-        search_fields = [
+        # Search fields to match against; several teams share fields like location
+        for field in (
             team_info.get('displayName', ''),
             team_info.get('shortDisplayName', ''),
             team_info.get('name', ''),
             team_info.get('location', ''),
             team_info.get('abbreviation', ''),
             team_info.get('slug', '')
-        ]
+        ):
+            if field:
+                fields.append(field)
+                fields_lower.append(field.lower())
+                teams.append(team_info)
 
-        # Find best match among all fields
-        for field in search_fields:
+        # Exact-match lookup; location is left to fuzzy matching since teams share it (e.g. New York)
+        for field in (
+            team_info.get('abbreviation', ''),
+            team_info.get('slug', ''),
+            team_info.get('name', ''),
+            team_info.get('shortDisplayName', ''),
+            team_info.get('displayName', '')
+        ):
             if field:
-                score = similarity(search_term, field)
-                if score > best_score:
-                    best_score = score
-                    best_match = {
-                        'id': team_info['id'],
-                        'name': team_info['displayName'],
-                        'abbreviation': team_info['abbreviation'],
-                        'location': team_info['location'],
-                        'score': score
-                    }
-
-    return best_match if best_score > 0.3 else None
+                exact.setdefault(field.lower(), team_info)
+
+    index = {'fields': fields, 'fields_lower': fields_lower, 'teams': teams, 'exact': exact}
+    _index_cache = (teams_data, index)
+    return index
+
+def _team_result(team_info, score):
+    """Build the match result returned by find_team_id"""
+    return {
+        'id': team_info['id'],
+        'name': team_info['displayName'],
+        'abbreviation': team_info['abbreviation'],
+        'location': team_info['location'],
+        'score': score
+    }
+
+def _find_team_id_rapidfuzz(search_term, index):
+    """Score every team field in one rapidfuzz call and return the best match"""
+    # WRatio scores 0-100; keep the 0-1 confidence and 0.3 cutoff used by the difflib path
+    match = process.extractOne(
+        search_term, index['fields'], scorer=fuzz.WRatio, processor=utils.default_process, score_cutoff=30
+    )
+    if not match:
+        return None
+
+    _, score, position = match
+    return _team_result(index['teams'][position], score / 100)
 
 def main():
     if len(sys.argv) != 2:
@@ -0,0 +1,47 @@
+"""
+Load the plugin as a package outside the host scoreboard app.
+
+The plugin imports a couple of host modules (boards.base_board, utils); minimal
+stand-ins are registered here so board.py can be imported on its own.
+"""
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+PLUGIN_DIR = Path(__file__).resolve().parent.parent
+PLUGIN_PACKAGE = "nfl_board"
+
+
+class _BoardBase:
+    def __init__(self, data, matrix, sleepEvent):
+        self.data = data
+        self.matrix = matrix
+        self.sleepEvent = sleepEvent
+
+
+def _install_host_modules():
+    boards = types.ModuleType("boards")
+    base_board = types.ModuleType("boards.base_board")
+    base_board.BoardBase = _BoardBase
+    boards.base_board = base_board
+    utils = types.ModuleType("utils")
+    utils.get_file = lambda path: path
+    sys.modules.setdefault("boards", boards)
+    sys.modules.setdefault("boards.base_board", base_board)
+    sys.modules.setdefault("utils", utils)
+
+
+def _load_plugin_package():
+    if PLUGIN_PACKAGE in sys.modules:
+        return
+    spec = importlib.util.spec_from_file_location(
+        PLUGIN_PACKAGE, PLUGIN_DIR / "__init__.py", submodule_search_locations=[str(PLUGIN_DIR)]
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[PLUGIN_PACKAGE] = package
+    spec.loader.exec_module(package)
+
+
+_install_host_modules()
+_load_plugin_package()
@@ -0,0 +1,11 @@
+"""Tests for the text formatters used by the team summary."""
+from nfl_board.board import NFLBoard
+
+
+def test_next_game_display_without_a_game():
+    board = NFLBoard.__new__(NFLBoard)
+
+    display = board._format_next_game_display(None, "1")
+
+    assert display.game_time == ""
+    assert display.opponent_text == "---"
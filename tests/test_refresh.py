@@ -0,0 +1,89 @@
+"""Tests for building a data snapshot during a board refresh."""
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from nfl_board.board import NFLBoard, NFLBoardConfig
+from nfl_board.data import NFLGame, NFLTeam
+
+FAVORITE_ID = "1"
+OPPONENT_ID = "2"
+
+
+def _team(team_id, abbreviation, **record):
+    return NFLTeam(
+        team_id=team_id,
+        name=abbreviation,
+        abbreviation=abbreviation,
+        display_name=abbreviation,
+        location=abbreviation,
+        color_primary=(255, 255, 255),
+        color_secondary=(0, 0, 0),
+        **record,
+    )
+
+
+class SlowDetailsApiClient:
+    """
+    Fake API client that, like NFLApiClient, builds games from teams_cache and
+    replaces cache entries when details load. Details finish after games are parsed.
+    """
+
+    def __init__(self):
+        self.teams_cache = {
+            FAVORITE_ID: _team(FAVORITE_ID, "ATL"),
+            OPPONENT_ID: _team(OPPONENT_ID, "NO"),
+        }
+        self.games_parsed = threading.Event()
+
+    def get_all_teams(self):
+        return self.teams_cache
+
+    def team_details_expired(self, team_id):
+        return True
+
+    def populate_team_details(self, team_ids):
+        self.games_parsed.wait(timeout=5)
+        time.sleep(0.05)
+        for team_id in team_ids:
+            basic = self.teams_cache[team_id]
+            self.teams_cache[team_id] = _team(team_id, basic.abbreviation, record_summary="5-3")
+        return len(team_ids)
+
+    def _game(self, game_id):
+        return NFLGame(
+            game_id=game_id,
+            date=datetime(2026, 10, 18, 17, tzinfo=timezone.utc),
+            home_team=self.teams_cache[FAVORITE_ID],
+            away_team=self.teams_cache[OPPONENT_ID],
+        )
+
+    def get_scoreboard_for_date(self, date):
+        return [self._game(f"scoreboard-{date:%Y%m%d}")]
+
+    def get_team_schedule(self, team_id):
+        schedule = [self._game("upcoming")]
+        self.games_parsed.set()
+        return schedule
+
+
+def _make_board(api_client):
+    board = NFLBoard.__new__(NFLBoard)
+    board.config = NFLBoardConfig({"team_ids": [FAVORITE_ID]})
+    board.api_client = api_client
+    board.data = SimpleNamespace(nfl_board_snapshot=None)
+    return board
+
+
+def test_games_use_detailed_teams_loaded_during_refresh():
+    snapshot = _make_board(SlowDetailsApiClient())._build_data_snapshot()
+
+    assert not snapshot.error_message
+    assert snapshot.all_teams[FAVORITE_ID].record_text == "5-3"
+    upcoming = snapshot.team_schedules[FAVORITE_ID][0]
+    assert upcoming.home_team is snapshot.all_teams[FAVORITE_ID]
+    assert upcoming.away_team.record_text == "5-3"
+    for game in snapshot.todays_games + snapshot.yesterdays_games:
+        assert game.home_team is snapshot.all_teams[FAVORITE_ID]
+        assert game.away_team is snapshot.all_teams[OPPONENT_ID]